@@ -0,0 +1,214 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+import datetime
+import numpy as np
+
+
+class _GrowableArray(object):
+    """_GrowableArray
+    List-like record of numbers stored in numpy.ndarray.
+    The buffer grows geometrically, so append is amortized O(1).
+
+    Args:
+        iterable (Iterable[float], optional):
+            Initial values.
+            Defaults to None -> [].
+        dtype (numpy.dtype, optional):
+            Data type of the buffer.
+            Defaults to numpy.float64.
+        capacity (int, optional):
+            Initial size of the buffer.
+            Defaults to 16.
+    """
+
+    def __init__(self, iterable=None, dtype=np.float64, capacity=16):
+        values = np.asarray(list(iterable) if iterable is not None else [], dtype=dtype)
+        self.size = len(values)
+        self.buf = np.empty(max(capacity, self.size), dtype=dtype)
+        self.buf[: self.size] = values
+
+    def append(self, value):
+        """
+        Append value to the end of this record.
+
+        Args:
+            value (float):
+                Appended value
+        """
+        if self.size == len(self.buf):
+            buf = np.empty(max(2 * len(self.buf), 1), dtype=self.buf.dtype)
+            buf[: self.size] = self.buf[: self.size]
+            self.buf = buf
+        self.buf[self.size] = value
+        self.size += 1
+
+    def extend(self, iterable):
+        """
+        Extend this record by values in iterable.
+
+        Args:
+            iterable (Iterable[float]):
+                Appended values
+        """
+        for value in iterable:
+            self.append(value)
+
+    def clear(self):
+        """
+        Remove all values of this record. The buffer is kept for reusing.
+        """
+        self.size = 0
+
+    def view(self):
+        """
+        Get the recorded values without copying.
+
+        Returns:
+            numpy.ndarray: View of the recorded values
+        """
+        return self.buf[: self.size]
+
+    def tolist(self):
+        """
+        Returns:
+            List[float]: Recorded values
+        """
+        return self.view().tolist()
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.view(), dtype=dtype)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.view()[index].tolist()
+        return self.view()[index].item()
+
+    def __setitem__(self, index, value):
+        self.view()[index] = value
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, _GrowableArray):
+            other = other.view()
+        try:
+            return self.size == len(other) and bool(np.all(self.view() == other))
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+
+def _get_layout(G, layout, pos_cache=None):
+    """
+    Get layout of networkx graph G with caching.
+
+    Args:
+        G (networkx.Digraph):
+            The information of networkx graph.
+        layout (str):
+            Layout of networkx.
+            "spring" or "shell" is available.
+        pos_cache (Dict[str, Tuple[networkx.Digraph, dict]], optional):
+            Cache of the last layout of each kind.
+            The cached layout is reused only for the same graph object,
+            so give it only for graphs which are rebuilt on change.
+            Defaults to None -> layout is not cached.
+
+    Returns:
+        dict: Layout of G
+    """
+    import networkx as nx
+
+    layout_function_map = {
+        "spring": nx.spring_layout,
+        "shell": nx.shell_layout,
+    }
+    if layout not in layout_function_map:
+        raise ValueError("layout must be one of " + str(list(layout_function_map)))
+    if pos_cache is None:
+        return layout_function_map[layout](G)
+    cached = pos_cache.get(layout)
+    if cached is not None and cached[0] is G:
+        return cached[1]
+    pos = layout_function_map[layout](G)
+    pos_cache[layout] = (G, pos)
+    return pos
+
+
+def _get_datetime_str_list(init_datetime, unit_timedelta, time_array):
+    """
+    Get datetime strings of init_datetime + time * unit_timedelta for each time.
+
+    Args:
+        init_datetime (datetime.datetime):
+            Start datetime of project
+        unit_timedelta (datetime.timedelta):
+            Unit time of simulation
+        time_array (numpy.ndarray):
+            Simulation times
+
+    Returns:
+        List[str]: Datetime strings in "%Y-%m-%d %H:%M:%S" format
+    """
+    unit_microseconds = unit_timedelta // datetime.timedelta(microseconds=1)
+    offset = np.rint(np.asarray(time_array, dtype=np.float64) * unit_microseconds)
+    datetime_array = np.datetime64(init_datetime, "us") + offset.astype(
+        "timedelta64[us]"
+    )
+    # "YYYY-MM-DDTHH:MM:SS" -> "YYYY-MM-DD HH:MM:SS" for all strings at once
+    str_array = np.datetime_as_string(datetime_array, unit="s").astype("U19")
+    char_array = str_array.view("U1").reshape(len(str_array), 19)
+    char_array[:, 10] = " "
+    return str_array.tolist()
+
+
+def _add_bar_collection(ax, left, width, bottom, height, color):
+    """
+    Add horizontal bars to ax as one collection.
+    This is equal to calling ax.broken_barh for each bar.
+
+    Args:
+        ax (matplotlib.axes.Axes):
+            Target axes
+        left (numpy.ndarray):
+            Left end of each bar
+        width (numpy.ndarray):
+            Width of each bar
+        bottom (numpy.ndarray):
+            Bottom of each bar
+        height (float):
+            Height of bars
+        color (str):
+            Face color of bars
+
+    Returns:
+        matplotlib.collections.PolyCollection: Added collection
+    """
+    from matplotlib.collections import PolyCollection
+
+    left = np.asarray(left, dtype=np.float64)
+    right = left + np.asarray(width, dtype=np.float64)
+    bottom = np.asarray(bottom, dtype=np.float64)
+    top = bottom + height
+    verts = np.stack(
+        [
+            np.stack([left, bottom], axis=-1),
+            np.stack([left, top], axis=-1),
+            np.stack([right, top], axis=-1),
+            np.stack([right, bottom], axis=-1),
+        ],
+        axis=1,
+    )
+    collection = PolyCollection(verts, facecolors=color)
+    ax.add_collection(collection, autolim=True)
+    ax.autoscale_view()
+    return collection
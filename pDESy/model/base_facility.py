@@ -5,14 +5,245 @@ import abc
 import uuid
 from enum import IntEnum
 import numpy as np
+from ._fast import _GrowableArray
 from .base_task import BaseTaskState
 
+# States of a task counted as working in get_work_amount_skill_progress()
+_WORKING_STATES = frozenset({BaseTaskState.WORKING, BaseTaskState.WORKING_ADDITIONALLY})
+
 
 class BaseFacilityState(IntEnum):
     FREE = 0
     WORKING = 1
 
 
+# BaseFacilityState indexed by its value
+_FACILITY_STATES = tuple(BaseFacilityState)
+
+
+class FacilityPool(object):
+    """FacilityPool
+    Column-wise storage of the simulation variables of facilities.
+    A facility registered to this pool reads and writes its state,
+    cost_per_time and assigned_task_id_record through its index in these arrays.
+    A facility can be registered to only one pool at a time.
+
+    Args:
+        facility_list (List[BaseFacility], optional):
+            List of BaseFacility registered to this pool.
+            Defaults to None -> [].
+    """
+
+    def __init__(self, facility_list=None):
+        self.facility_list = []
+        self.state = np.zeros(0, dtype=np.int8)
+        self.cost_per_time = np.zeros(0, dtype=np.float64)
+        # (time, facility) array of assigned task id tuples
+        self.assigned_task_id_record = np.empty((0, 0), dtype=object)
+        self.record_length = np.zeros(0, dtype=np.int64)
+        if facility_list is not None:
+            self.build(facility_list)
+
+    def __len__(self):
+        return len(self.facility_list)
+
+    def is_synced(self, facility_list):
+        """
+        Check whether this pool has the same facilities as facility_list.
+
+        Args:
+            facility_list (List[BaseFacility]):
+                List of BaseFacility
+
+        Returns:
+            bool: whether this pool is up to date or not
+        """
+        return self.facility_list == facility_list
+
+    def build(self, facility_list):
+        """
+        (Re)build the arrays of this pool from facility_list.
+
+        Args:
+            facility_list (List[BaseFacility]):
+                List of BaseFacility registered to this pool.
+
+        Raises:
+            ValueError: if a facility is already registered to another pool.
+        """
+        for facility in facility_list:
+            if facility._pool is not None and facility._pool is not self:
+                raise ValueError(
+                    "{} is already registered to another factory".format(facility.name)
+                )
+
+        # Read the current values before the arrays are replaced.
+        state = [int(facility.state) for facility in facility_list]
+        cost_per_time = [facility.cost_per_time for facility in facility_list]
+        record_list = [
+            list(facility.assigned_task_id_record) for facility in facility_list
+        ]
+
+        # Facilities removed from this pool keep their values locally.
+        new_id_set = set(map(id, facility_list))
+        for facility in self.facility_list:
+            if id(facility) not in new_id_set and facility._pool is self:
+                facility._detach_pool()
+
+        self.facility_list = list(facility_list)
+        self.state = np.array(state, dtype=np.int8)
+        self.cost_per_time = np.array(cost_per_time, dtype=np.float64)
+        self.assigned_task_id_record = np.empty((0, len(facility_list)), dtype=object)
+        self.record_length = np.zeros(len(facility_list), dtype=np.int64)
+        for idx, facility in enumerate(self.facility_list):
+            facility._pool = self
+            facility._idx = idx
+            self.set_assigned_task_id_record(idx, record_list[idx])
+
+    def _reserve_record(self, size):
+        """
+        Grow assigned_task_id_record in power-of-two chunks to hold size records.
+        """
+        capacity = self.assigned_task_id_record.shape[0]
+        if size <= capacity:
+            return
+        new_capacity = max(capacity, 1)
+        while new_capacity < size:
+            new_capacity *= 2
+        record = np.empty((new_capacity, len(self.facility_list)), dtype=object)
+        record[:capacity] = self.assigned_task_id_record
+        self.assigned_task_id_record = record
+
+    def set_assigned_task_id_record(self, idx, record):
+        """
+        Set the record of assigned task id of the facility.
+
+        Args:
+            idx (int):
+                Index of the facility in this pool
+            record (List[List[str]]):
+                Record of assigned task id of the facility
+        """
+        self._reserve_record(len(record))
+        for time, task_id_list in enumerate(record):
+            self.assigned_task_id_record[time, idx] = task_id_list
+        self.record_length[idx] = len(record)
+
+    def append_assigned_task_id(self, idx, task_id_list):
+        """
+        Append assigned task id in this time to the record of the facility.
+
+        Args:
+            idx (int):
+                Index of the facility in this pool
+            task_id_list (List[str]):
+                Assigned task id in this time
+        """
+        length = self.record_length[idx]
+        self._reserve_record(length + 1)
+        self.assigned_task_id_record[length, idx] = task_id_list
+        self.record_length[idx] = length + 1
+
+    def record_assigned_task_id(self):
+        """
+        Record assigned task id of all facilities in this time.
+        """
+        if len(self.facility_list) == 0:
+            return
+        if self.record_length.min() != self.record_length.max():
+            for idx, facility in enumerate(self.facility_list):
+                self.append_assigned_task_id(
+                    idx, [task.ID for task in facility.assigned_task_list]
+                )
+            return
+        time = int(self.record_length[0])
+        self._reserve_record(time + 1)
+        for idx, facility in enumerate(self.facility_list):
+            self.assigned_task_id_record[time, idx] = [
+                task.ID for task in facility.assigned_task_list
+            ]
+        self.record_length += 1
+
+
+class _AssignedTaskIdRecord(object):
+    """_AssignedTaskIdRecord
+    Live list-like view of assigned_task_id_record of a facility.
+    Values are read from and appended to FacilityPool while the facility
+    is registered to it, and to the local list of the facility otherwise.
+
+    Args:
+        facility (BaseFacility):
+            Owner of this record.
+    """
+
+    __slots__ = ("_facility",)
+
+    def __init__(self, facility):
+        self._facility = facility
+
+    def _values(self):
+        facility = self._facility
+        if facility._pool is None:
+            return facility._assigned_task_id_record
+        pool = facility._pool
+        return pool.assigned_task_id_record[
+            : pool.record_length[facility._idx], facility._idx
+        ]
+
+    def append(self, task_id_list):
+        """
+        Append assigned task id in this time to this record.
+
+        Args:
+            task_id_list (List[str]):
+                Assigned task id in this time
+        """
+        facility = self._facility
+        if facility._pool is None:
+            facility._assigned_task_id_record.append(task_id_list)
+        else:
+            facility._pool.append_assigned_task_id(facility._idx, task_id_list)
+
+    def extend(self, iterable):
+        """
+        Extend this record by assigned task id in iterable.
+
+        Args:
+            iterable (Iterable[List[str]]):
+                Appended assigned task id
+        """
+        for task_id_list in iterable:
+            self.append(task_id_list)
+
+    def tolist(self):
+        """
+        Returns:
+            List[List[str]]: Copy of this record
+        """
+        return list(self._values())
+
+    def __len__(self):
+        return len(self._values())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._values()[index])
+        return self._values()[index]
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, _AssignedTaskIdRecord):
+            other = other.tolist()
+        return self.tolist() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+
 class BaseFacility(object, metaclass=abc.ABCMeta):
     """BaseFacility
     BaseResource class for expressing a factory.
@@ -41,11 +272,11 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
         workamount_skill_mean_map (Dict[str, float], optional):
             Basic parameter.
             Skill for expressing progress in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         workamount_skill_sd_map (Dict[str, float], optional):
             Basic parameter.
             Standard deviation of skill for expressing progress in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         state (BaseFacilityState, optional):
             Basic variable.
             State of this resource in simulation.
@@ -72,6 +303,24 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
             Defaults to None -> [].
     """
 
+    __slots__ = (
+        "_pool",
+        "_idx",
+        "name",
+        "ID",
+        "factory_id",
+        "_cost_per_time",
+        "solo_working",
+        "workamount_skill_mean_map",
+        "workamount_skill_sd_map",
+        "_state",
+        "cost_list",
+        "start_time_list",
+        "finish_time_list",
+        "assigned_task_list",
+        "_assigned_task_id_record",
+    )
+
     def __init__(
         self,
         # Basic parameters
@@ -80,8 +329,8 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
         factory_id=None,
         cost_per_time=0.0,
         solo_working=False,
-        workamount_skill_mean_map={},
-        workamount_skill_sd_map={},
+        workamount_skill_mean_map=None,
+        workamount_skill_sd_map=None,
         # Basic variables
         state=BaseFacilityState.FREE,
         cost_list=None,
@@ -91,6 +340,10 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
         assigned_task_id_record=None,
     ):
 
+        # Index in FacilityPool of the factory (None if not registered)
+        self._pool = None
+        self._idx = None
+
         # ----
         # Constraint parameter on simulation
         # --
@@ -98,10 +351,10 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
         self.name = name
         self.ID = ID if ID is not None else str(uuid.uuid4())
         self.factory_id = factory_id if factory_id is not None else None
-        self.cost_per_time = cost_per_time if cost_per_time != 0.0 else 0.0
+        self.cost_per_time = cost_per_time
         self.solo_working = solo_working if solo_working is not None else False
         self.workamount_skill_mean_map = (
-            workamount_skill_mean_map if workamount_skill_mean_map is not {} else {}
+            workamount_skill_mean_map if workamount_skill_mean_map is not None else {}
         )
         self.workamount_skill_sd_map = (
             workamount_skill_sd_map if workamount_skill_sd_map is not None else {}
@@ -117,9 +370,9 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
             self.state = BaseFacilityState.FREE
 
         if cost_list is not None:
-            self.cost_list = cost_list
+            self.cost_list = _GrowableArray(cost_list)
         else:
-            self.cost_list = []
+            self.cost_list = _GrowableArray()
 
         if start_time_list is not None:
             self.start_time_list = start_time_list
@@ -141,6 +394,63 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
         else:
             self.assigned_task_id_record = []
 
+    @property
+    def state(self):
+        if self._pool is None:
+            return self._state
+        return _FACILITY_STATES[self._pool.state[self._idx]]
+
+    @state.setter
+    def state(self, state):
+        # BaseResourceState or int is stored as BaseFacilityState.
+        state = BaseFacilityState(state)
+        if self._pool is None:
+            self._state = state
+        else:
+            self._pool.state[self._idx] = state
+
+    @property
+    def cost_per_time(self):
+        if self._pool is None:
+            return self._cost_per_time
+        return float(self._pool.cost_per_time[self._idx])
+
+    @cost_per_time.setter
+    def cost_per_time(self, cost_per_time):
+        if self._pool is None:
+            self._cost_per_time = cost_per_time
+        else:
+            self._pool.cost_per_time[self._idx] = cost_per_time
+
+    @property
+    def assigned_task_id_record(self):
+        if self._pool is None:
+            return self._assigned_task_id_record
+        return _AssignedTaskIdRecord(self)
+
+    @assigned_task_id_record.setter
+    def assigned_task_id_record(self, assigned_task_id_record):
+        if isinstance(assigned_task_id_record, _AssignedTaskIdRecord):
+            assigned_task_id_record = assigned_task_id_record.tolist()
+        if self._pool is None:
+            self._assigned_task_id_record = assigned_task_id_record
+        else:
+            self._pool.set_assigned_task_id_record(self._idx, assigned_task_id_record)
+
+    def _detach_pool(self):
+        """
+        Move state, cost_per_time and assigned_task_id_record
+        from FacilityPool to this facility.
+        """
+        state = self.state
+        cost_per_time = self.cost_per_time
+        assigned_task_id_record = list(self.assigned_task_id_record)
+        self._pool = None
+        self._idx = None
+        self.state = state
+        self.cost_per_time = cost_per_time
+        self.assigned_task_id_record = assigned_task_id_record
+
     def __str__(self):
         """
         Returns:
@@ -164,7 +474,7 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
         - assigned_task_id_record
         """
         self.state = BaseFacilityState.FREE
-        self.cost_list = []
+        self.cost_list = _GrowableArray()
         self.start_time_list = []
         self.finish_time_list = []
         self.assigned_task_list = []
@@ -174,9 +484,11 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
         """
         Record assigned task id in this time.
         """
-        self.assigned_task_id_record.append(
-            [task.ID for task in self.assigned_task_list]
-        )
+        task_id_list = [task.ID for task in self.assigned_task_list]
+        if self._pool is None:
+            self._assigned_task_id_record.append(task_id_list)
+        else:
+            self._pool.append_assigned_task_id(self._idx, task_id_list)
 
     def has_workamount_skill(self, task_name, error_tol=1e-10):
         """
@@ -193,10 +505,8 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
         Returns:
             bool: whether he or she has workamount skill of task_name or not
         """
-        if task_name in self.workamount_skill_mean_map:
-            if self.workamount_skill_mean_map[task_name] > 0.0 + error_tol:
-                return True
-        return False
+        skill_mean = self.workamount_skill_mean_map.get(task_name)
+        return skill_mean is not None and skill_mean > 0.0 + error_tol
 
     def get_work_amount_skill_progress(self, task_name, seed=None):
         """
@@ -226,16 +536,12 @@ class BaseFacility(object, metaclass=abc.ABCMeta):
         if not self.has_workamount_skill(task_name):
             return 0.0
         skill_mean = self.workamount_skill_mean_map[task_name]
-        if task_name not in self.workamount_skill_sd_map:
-            skill_sd = 0
+        skill_sd = self.workamount_skill_sd_map.get(task_name, 0.0)
+        if skill_sd == 0.0:
+            base_progress = skill_mean
         else:
-            skill_sd = self.workamount_skill_sd_map[task_name]
-        base_progress = np.random.normal(skill_mean, skill_sd)
+            base_progress = np.random.normal(skill_mean, skill_sd)
         sum_of_working_task_in_this_time = sum(
-            map(
-                lambda task: task.state == BaseTaskState.WORKING
-                or task.state == BaseTaskState.WORKING_ADDITIONALLY,
-                self.assigned_task_list,
-            )
+            1 for task in self.assigned_task_list if task.state in _WORKING_STATES
         )
         return base_progress / float(sum_of_working_task_in_this_time)
@@ -3,7 +3,9 @@
 
 import abc
 import uuid
-from .base_facility import BaseFacilityState
+import numpy as np
+from ._fast import _GrowableArray, _get_datetime_str_list
+from .base_facility import BaseFacilityState, FacilityPool
 import plotly.graph_objects as go
 import plotly.figure_factory as ff
 import datetime
@@ -71,6 +73,7 @@ class BaseFactory(object, metaclass=abc.ABCMeta):
         self.ID = ID if ID is not None else str(uuid.uuid4())
 
         self.facility_list = facility_list if facility_list is not None else []
+        self._facility_pool = FacilityPool(self.facility_list)
         for facility in self.facility_list:
             if facility.factory_id is None:
                 facility.factory_id = self.ID
@@ -86,9 +89,9 @@ class BaseFactory(object, metaclass=abc.ABCMeta):
         # --
         # Basic variables
         if cost_list is not None:
-            self.cost_list = cost_list
+            self.cost_list = _GrowableArray(cost_list)
         else:
-            self.cost_list = []
+            self.cost_list = _GrowableArray()
 
         if placed_component_list is not None:
             self.placed_component_list = placed_component_list
@@ -123,10 +126,26 @@ class BaseFactory(object, metaclass=abc.ABCMeta):
         Args:
             facility (BaseFacility):
                 Facility which is added to this factory
+
+        Raises:
+            ValueError: if facility already belongs to another factory.
         """
+        self._facility_pool.build(self.facility_list + [facility])
         facility.factory_id = self.ID
         self.facility_list.append(facility)
 
+    def get_facility_pool(self):
+        """
+        Get FacilityPool of facility_list.
+        FacilityPool is rebuilt if facility_list was changed directly.
+
+        Returns:
+            FacilityPool: FacilityPool of this factory
+        """
+        if not self._facility_pool.is_synced(self.facility_list):
+            self._facility_pool.build(self.facility_list)
+        return self._facility_pool
+
     def get_total_workamount_skill(self, task_name, error_tol=1e-10):
         """
         Get total number of workamount skill of all facilities
@@ -228,7 +247,7 @@ class BaseFactory(object, metaclass=abc.ABCMeta):
         - placed_component_id_record
         - changeable variable of BaseFacility in facility_list
         """
-        self.cost_list = []
+        self.cost_list = _GrowableArray()
         self.placed_component_list = []
         self.placed_component_id_record = []
         for w in self.facility_list:
@@ -251,26 +270,20 @@ class BaseFactory(object, metaclass=abc.ABCMeta):
         Returns:
             float: Total labor cost of this factory in this time.
         """
-        cost_this_time = 0.0
+        pool = self.get_facility_pool()
 
         if add_zero_to_all_facilities:
-            for facility in self.facility_list:
-                facility.cost_list.append(0.0)
-
+            cost_array = np.zeros(len(pool))
+        elif only_working:
+            cost_array = np.where(
+                pool.state == BaseFacilityState.WORKING, pool.cost_per_time, 0.0
+            )
         else:
+            cost_array = pool.cost_per_time
 
-            if only_working:
-                for facility in self.facility_list:
-                    if facility.state == BaseFacilityState.WORKING:
-                        facility.cost_list.append(facility.cost_per_time)
-                        cost_this_time += facility.cost_per_time
-                    else:
-                        facility.cost_list.append(0.0)
-
-            else:
-                for facility in self.facility_list:
-                    facility.cost_list.append(facility.cost_per_time)
-                    cost_this_time += facility.cost_per_time
+        for facility, cost in zip(pool.facility_list, cost_array.tolist()):
+            facility.cost_list.append(cost)
+        cost_this_time = float(cost_array.sum())
 
         self.cost_list.append(cost_this_time)
         return cost_this_time
@@ -279,8 +292,7 @@ class BaseFactory(object, metaclass=abc.ABCMeta):
         """
         Record assigned task id in this time.
         """
-        for resource in self.facility_list:
-            resource.record_assigned_task_id()
+        self.get_facility_pool().record_assigned_task_id()
 
     def record_placed_component_id(self):
         """
@@ -433,12 +445,11 @@ class BaseFactory(object, metaclass=abc.ABCMeta):
             data (List[go.Bar(name, x, y)]: Information of cost history chart.
         """
         data = []
-        x = [
-            (init_datetime + time * unit_timedelta).strftime("%Y-%m-%d %H:%M:%S")
-            for time in range(len(self.cost_list))
-        ]
+        x = _get_datetime_str_list(
+            init_datetime, unit_timedelta, np.arange(len(self.cost_list))
+        )
         for facility in self.facility_list:
-            data.append(go.Bar(name=facility.name, x=x, y=facility.cost_list))
+            data.append(go.Bar(name=facility.name, x=x, y=list(facility.cost_list)))
         return data
 
     def create_cost_history_plotly(
@@ -2,16 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import abc
+from itertools import chain
 from typing import List
 from .base_team import BaseTeam
 from .base_factory import BaseFactory
 from .base_worker import BaseWorker
 from .base_facility import BaseFacility
-import plotly.figure_factory as ff
-import networkx as nx
-import plotly.graph_objects as go
 import datetime
-import matplotlib.pyplot as plt
+import numpy as np
+from ._fast import _GrowableArray, _get_layout, _get_datetime_str_list
 
 
 class BaseOrganization(object, metaclass=abc.ABCMeta):
@@ -34,6 +33,15 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
             Defaults to None -> [].
     """
 
+    __slots__ = (
+        "team_list",
+        "factory_list",
+        "cost_list",
+        "_graph_cache",
+        "_graph_cache_key",
+        "_pos_cache",
+    )
+
     def __init__(
         self,
         # Basic parameters
@@ -55,10 +63,16 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
         # Changeable variables on simulation
         # --
         # Basic variables
-        self.cost_list = []
+        self.cost_list = _GrowableArray()
         # --
         # Advanced variables for customized simulation
 
+        # ----
+        # Cache of networkx graph
+        self._graph_cache = None
+        self._graph_cache_key = None
+        self._pos_cache = {}
+
     def __str__(self):
         """
         Returns:
@@ -68,7 +82,7 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
             >>> print([t.name for t in o.team_list])
             ['t1']
         """
-        return "{}".format(list(map(lambda team: str(team), self.team_list)))
+        return str([team.name for team in self.team_list])
 
     def initialize(self):
         """
@@ -78,7 +92,7 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
         - changeable variables of BaseTeam in team_list
 
         """
-        self.cost_list = []
+        self.cost_list = _GrowableArray()
         for team in self.team_list:
             team.initialize()
         for factory in self.factory_list:
@@ -186,6 +200,8 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
             view_worker=False mode should be implemented.
             view_facility=False mode should be implemented.
         """
+        import matplotlib.pyplot as plt
+
         fig, gnt = plt.subplots()
         gnt.set_xlabel("step")
         gnt.grid(True)
@@ -266,20 +282,14 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
         Returns:
             List[dict]: Gantt plotly information of this BaseOrganization.
         """
-        df = []
-        for team in self.team_list:
-            df.extend(
-                team.create_data_for_gantt_plotly(
+        return list(
+            chain.from_iterable(
+                resource_group.create_data_for_gantt_plotly(
                     init_datetime, unit_timedelta, finish_margin=finish_margin
                 )
+                for resource_group in chain(self.team_list, self.factory_list)
             )
-        for factory in self.factory_list:
-            df.extend(
-                factory.create_data_for_gantt_plotly(
-                    init_datetime, unit_timedelta, finish_margin=finish_margin
-                )
-            )
-        return df
+        )
 
     def create_gantt_plotly(
         self,
@@ -339,6 +349,8 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
         TODO:
             Saving figure file is not implemented...
         """
+        import plotly.figure_factory as ff
+
         colors = (
             colors
             if colors is not None
@@ -379,15 +391,16 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
         Returns:
             data (List[go.Bar(name, x, y)]: Information of cost history chart.
         """
+        import plotly.graph_objects as go
+
         data = []
-        x = [
-            (init_datetime + time * unit_timedelta).strftime("%Y-%m-%d %H:%M:%S")
-            for time in range(len(self.cost_list))
-        ]
+        x = _get_datetime_str_list(
+            init_datetime, unit_timedelta, np.arange(len(self.cost_list))
+        )
         for team in self.team_list:
-            data.append(go.Bar(name=team.name, x=x, y=team.cost_list))
+            data.append(go.Bar(name=team.name, x=x, y=list(team.cost_list)))
         for factory in self.factory_list:
-            data.append(go.Bar(name=factory.name, x=x, y=factory.cost_list))
+            data.append(go.Bar(name=factory.name, x=x, y=list(factory.cost_list)))
         return data
 
     def create_cost_history_plotly(
@@ -419,6 +432,8 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
         TODO:
             Saving figure file is not implemented...
         """
+        import plotly.graph_objects as go
+
         data = self.create_data_for_cost_history_plotly(init_datetime, unit_timedelta)
         fig = go.Figure(data)
         fig.update_layout(barmode="stack", title=title)
@@ -437,43 +452,94 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
                 Default to False.
         Returns:
             G: networkx.Digraph()
+
+        Note:
+            The graph is cached and reused while the structure of
+            this organization is not changed. Copy it before modifying.
         """
+        import networkx as nx
+
+        key = self._get_networkx_graph_key(view_workers, view_facilities)
+        if self._graph_cache is not None and self._graph_cache_key == key:
+            return self._graph_cache
+
         G = nx.DiGraph()
 
         # BaseTeam
         # 1. add all nodes
-        for team in self.team_list:
-            G.add_node(team)
+        G.add_nodes_from(self.team_list)
 
         # 2. add all edges
-        for team in self.team_list:
-            if team.parent_team is not None:
-                G.add_edge(team.parent_team, team)
+        G.add_edges_from(
+            (team.parent_team, team)
+            for team in self.team_list
+            if team.parent_team is not None
+        )
 
         if view_workers:
             for team in self.team_list:
-                for w in team.worker_list:
-                    G.add_node(w)
-                    G.add_edge(team, w)
+                G.add_nodes_from(team.worker_list)
+                G.add_edges_from((team, w) for w in team.worker_list)
 
         # BaseFactory
         # 1. add all nodes
-        for factory in self.factory_list:
-            G.add_node(factory)
+        G.add_nodes_from(self.factory_list)
 
         # 2. add all edges
-        for factory in self.factory_list:
-            if factory.parent_factory is not None:
-                G.add_edge(factory.parent_factory, factory)
+        G.add_edges_from(
+            (factory.parent_factory, factory)
+            for factory in self.factory_list
+            if factory.parent_factory is not None
+        )
 
         if view_facilities:
             for factory in self.factory_list:
-                for w in factory.facility_list:
-                    G.add_node(w)
-                    G.add_edge(factory, w)
+                G.add_nodes_from(factory.facility_list)
+                G.add_edges_from((factory, w) for w in factory.facility_list)
 
+        self._graph_cache = G
+        self._graph_cache_key = key
         return G
 
+    def _get_networkx_graph_key(self, view_workers, view_facilities):
+        """
+        Get the key of the structure of this organization for caching networkx graph.
+        """
+        return (
+            view_workers,
+            view_facilities,
+            tuple((team, team.parent_team) for team in self.team_list),
+            tuple((factory, factory.parent_factory) for factory in self.factory_list),
+            tuple(tuple(team.worker_list) for team in self.team_list)
+            if view_workers
+            else None,
+            tuple(tuple(factory.facility_list) for factory in self.factory_list)
+            if view_facilities
+            else None,
+        )
+
+    def _get_graph_and_pos(
+        self,
+        G=None,
+        pos=None,
+        view_workers=False,
+        view_facilities=False,
+        layout="spring",
+    ):
+        """
+        Get networkx graph and its layout for drawing this organization.
+        The layout of the graph built by this class is cached and reused
+        while the graph is not rebuilt. The layout of a given G is not cached.
+        """
+        if G is not None:
+            return G, pos if pos is not None else _get_layout(G, layout)
+        G = self.get_networkx_graph(
+            view_workers=view_workers, view_facilities=view_facilities
+        )
+        if pos is None:
+            pos = _get_layout(G, layout, self._pos_cache)
+        return G, pos
+
     def draw_networkx(
         self,
         G=None,
@@ -486,6 +552,7 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
         view_facilities=False,
         factory_node_color="#0099FF",
         facility_node_color="#D9E5FF",
+        layout="spring",
         **kwds,
     ):
         """
@@ -497,7 +564,7 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
                 Defaults to None -> self.get_networkx_graph().
             pos (networkx.layout, optional):
                 Layout of networkx.
-                Defaults to None -> networkx.spring_layout(G).
+                Defaults to None -> layout of G by `layout`.
             arrows (bool, optional):
                 Digraph or Graph(no arrows).
                 Defaults to True.
@@ -522,19 +589,24 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
             facility_node_color (str, optional):
                 Node color setting information.
                 Defaults to "#D9E5FF".
+            layout (str, optional):
+                Layout of networkx used when pos is None.
+                "spring" or "shell" is available.
+                Defaults to "spring".
             **kwds:
                 another networkx settings.
         Returns:
             figure: Figure for a network
         """
-        G = (
-            G
-            if G is not None
-            else self.get_networkx_graph(
-                view_workers=view_workers, view_facilities=view_facilities
-            )
+        import networkx as nx
+
+        G, pos = self._get_graph_and_pos(
+            G=G,
+            pos=pos,
+            view_workers=view_workers,
+            view_facilities=view_facilities,
+            layout=layout,
         )
-        pos = pos if pos is not None else nx.spring_layout(G)
 
         # nx.draw_networkx(G, pos=pos, arrows=arrows, with_labels=with_labels, **kwds)
 
@@ -602,6 +674,7 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
         factory_node_color="#0099FF",
         facility_node_color="#D9E5FF",
         view_facilities=False,
+        layout="spring",
     ):
         """
         Get nodes and edges information of plotly network.
@@ -612,7 +685,7 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
                 Defaults to None -> self.get_networkx_graph().
             pos (networkx.layout, optional):
                 Layout of networkx.
-                Defaults to None -> networkx.spring_layout(G).
+                Defaults to None -> layout of G by `layout`.
             node_size (int, optional):
                 Node size setting information.
                 Defaults to 20.
@@ -634,6 +707,10 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
             view_facilities (bool, optional):
                 Including facilities in networkx graph or not.
                 Default to False.
+            layout (str, optional):
+                Layout of networkx used when pos is None.
+                "spring" or "shell" is available.
+                Defaults to "spring".
 
         Returns:
             team_node_trace: Team Node information of plotly network.
@@ -642,15 +719,15 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
             facility_node_trace: Facility Node information of plotly network.
             edge_trace: Edge information of plotly network.
         """
+        import plotly.graph_objects as go
 
-        G = (
-            G
-            if G is not None
-            else self.get_networkx_graph(
-                view_workers=view_workers, view_facilities=view_facilities
-            )
+        G, pos = self._get_graph_and_pos(
+            G=G,
+            pos=pos,
+            view_workers=view_workers,
+            view_facilities=view_facilities,
+            layout=layout,
         )
-        pos = pos if pos is not None else nx.spring_layout(G)
 
         team_node_trace = go.Scatter(
             x=[],
@@ -685,36 +762,43 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
             marker=dict(color=facility_node_color, size=node_size,),
         )
 
+        team_node_list = []
+        worker_node_list = []
+        factory_node_list = []
+        facility_node_list = []
         for node in G.nodes:
-            x, y = pos[node]
             if isinstance(node, BaseTeam):
-                team_node_trace["x"] = team_node_trace["x"] + (x,)
-                team_node_trace["y"] = team_node_trace["y"] + (y,)
-                team_node_trace["text"] = team_node_trace["text"] + (node,)
+                team_node_list.append(node)
             elif isinstance(node, BaseFactory):
-                factory_node_trace["x"] = factory_node_trace["x"] + (x,)
-                factory_node_trace["y"] = factory_node_trace["y"] + (y,)
-                factory_node_trace["text"] = factory_node_trace["text"] + (node,)
+                factory_node_list.append(node)
             elif isinstance(node, BaseFacility):
-                facility_node_trace["x"] = facility_node_trace["x"] + (x,)
-                facility_node_trace["y"] = facility_node_trace["y"] + (y,)
-                facility_node_trace["text"] = facility_node_trace["text"] + (node,)
+                facility_node_list.append(node)
             elif isinstance(node, BaseWorker):
-                worker_node_trace["x"] = worker_node_trace["x"] + (x,)
-                worker_node_trace["y"] = worker_node_trace["y"] + (y,)
-                worker_node_trace["text"] = worker_node_trace["text"] + (node,)
+                worker_node_list.append(node)
+
+        for node_trace, node_list in (
+            (team_node_trace, team_node_list),
+            (worker_node_trace, worker_node_list),
+            (factory_node_trace, factory_node_list),
+            (facility_node_trace, facility_node_list),
+        ):
+            node_trace["x"] = [pos[node][0] for node in node_list]
+            node_trace["y"] = [pos[node][1] for node in node_list]
+            node_trace["text"] = node_list
 
         edge_trace = go.Scatter(
             x=[], y=[], line=dict(width=1, color="#888"), hoverinfo="none", mode="lines"
         )
 
-        for edge in G.edges:
-            x = edge[0]
-            y = edge[1]
+        edge_x = []
+        edge_y = []
+        for x, y in G.edges:
             xposx, xposy = pos[x]
             yposx, yposy = pos[y]
-            edge_trace["x"] += (xposx, yposx)
-            edge_trace["y"] += (xposy, yposy)
+            edge_x.extend((xposx, yposx))
+            edge_y.extend((xposy, yposy))
+        edge_trace["x"] = edge_x
+        edge_trace["y"] = edge_y
 
         return (
             team_node_trace,
@@ -737,6 +821,7 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
         facility_node_color="#D9E5FF",
         view_facilities=False,
         save_fig_path=None,
+        layout="spring",
     ):
         """
         Draw plotly network
@@ -747,7 +832,7 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
                 Defaults to None -> self.get_networkx_graph().
             pos (networkx.layout, optional):
                 Layout of networkx.
-                Defaults to None -> networkx.spring_layout(G).
+                Defaults to None -> layout of G by `layout`.
             title (str, optional):
                 Figure title of this network.
                 Defaults to "Organization".
@@ -775,6 +860,10 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
             save_fig_path (str, optional):
                 Path of saving figure.
                 Defaults to None.
+            layout (str, optional):
+                Layout of networkx used when pos is None.
+                "spring" or "shell" is available.
+                Defaults to "spring".
 
         Returns:
             figure: Figure for a network
@@ -782,14 +871,15 @@ class BaseOrganization(object, metaclass=abc.ABCMeta):
         TODO:
             Saving figure file is not implemented...
         """
-        G = (
-            G
-            if G is not None
-            else self.get_networkx_graph(
-                view_workers=view_workers, view_facilities=view_facilities
-            )
+        import plotly.graph_objects as go
+
+        G, pos = self._get_graph_and_pos(
+            G=G,
+            pos=pos,
+            view_workers=view_workers,
+            view_facilities=view_facilities,
+            layout=layout,
         )
-        pos = pos if pos is not None else nx.spring_layout(G)
         (
             team_node_trace,
             worker_node_trace,
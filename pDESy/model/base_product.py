@@ -2,14 +2,12 @@
 # -*- coding: utf-8 -*-
 
 import abc
+from itertools import chain
 from typing import List
 from .base_component import BaseComponent
 from .base_task import BaseTaskState
-import plotly.figure_factory as ff
-import networkx as nx
-import plotly.graph_objects as go
+from ._fast import _get_layout
 import datetime
-import matplotlib.pyplot as plt
 
 
 class BaseProduct(object, metaclass=abc.ABCMeta):
@@ -23,6 +21,8 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
             List of BaseComponents
     """
 
+    __slots__ = ("component_list", "_graph_cache", "_graph_cache_key", "_pos_cache")
+
     def __init__(self, component_list: List[BaseComponent]):
         # ----
         # Constraint parameters on simulation
@@ -30,6 +30,12 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
         # Basic parameter
         self.component_list = component_list
 
+        # ----
+        # Cache of networkx graph
+        self._graph_cache = None
+        self._graph_cache_key = None
+        self._pos_cache = {}
+
     def initialize(self):
         """
         Initialize the changeable variables of BaseProduct
@@ -48,7 +54,7 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
             >>> print([c.name for c in p.component_list])
             ['c']
         """
-        return "{}".format(list(map(lambda c: str(c), self.component_list)))
+        return str([c.name for c in self.component_list])
 
     def record_placed_factory_id(self):
         """
@@ -121,6 +127,8 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
             fig: fig in plt.subplots()
             gnt: gnt in plt.subplots()
         """
+        import matplotlib.pyplot as plt
+
         fig, gnt = plt.subplots()
         gnt.set_xlabel("step")
         gnt.grid(True)
@@ -196,14 +204,14 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
         Returns:
             List[dict]: Gantt plotly information of this BaseProduct
         """
-        df = []
-        for component in self.component_list:
-            df.extend(
+        return list(
+            chain.from_iterable(
                 component.create_data_for_gantt_plotly(
                     init_datetime, unit_timedelta, finish_margin=finish_margin
                 )
+                for component in self.component_list
             )
-        return df
+        )
 
     def create_gantt_plotly(
         self,
@@ -262,6 +270,8 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
         TODO:
             Saving figure file is not implemented...
         """
+        import plotly.figure_factory as ff
+
         colors = colors if colors is not None else dict(Component="rgb(246, 37, 105)")
         index_col = index_col if index_col is not None else "Type"
         df = self.create_data_for_gantt_plotly(
@@ -289,20 +299,49 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
 
         Returns:
             G: networkx.Digraph()
+
+        Note:
+            The graph is cached and reused while the structure of
+            this product is not changed. Copy it before modifying.
         """
+        import networkx as nx
+
+        key = tuple(
+            (component, tuple(component.child_component_list))
+            for component in self.component_list
+        )
+        if self._graph_cache is not None and self._graph_cache_key == key:
+            return self._graph_cache
+
         G = nx.DiGraph()
 
         # 1. add all nodes
-        for component in self.component_list:
-            G.add_node(component)
+        G.add_nodes_from(self.component_list)
 
         # 2. add all edges
-        for component in self.component_list:
-            for child_c in component.child_component_list:
-                G.add_edge(component, child_c)
+        G.add_edges_from(
+            (component, child_c)
+            for component in self.component_list
+            for child_c in component.child_component_list
+        )
 
+        self._graph_cache = G
+        self._graph_cache_key = key
         return G
 
+    def _get_graph_and_pos(self, G=None, pos=None, layout="spring"):
+        """
+        Get networkx graph and its layout for drawing this product.
+        The layout of the graph built by this class is cached and reused
+        while the graph is not rebuilt. The layout of a given G is not cached.
+        """
+        if G is not None:
+            return G, pos if pos is not None else _get_layout(G, layout)
+        G = self.get_networkx_graph()
+        if pos is None:
+            pos = _get_layout(G, layout, self._pos_cache)
+        return G, pos
+
     def draw_networkx(
         self,
         G=None,
@@ -310,6 +349,7 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
         arrows=True,
         with_labels=True,
         component_node_color="#FF6600",
+        layout="spring",
         **kwds,
     ):
         """
@@ -321,7 +361,7 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
                 Defaults to None -> self.get_networkx_graph().
             pos (networkx.layout, optional):
                 Layout of networkx.
-                Defaults to None -> networkx.spring_layout(G).
+                Defaults to None -> layout of G by `layout`.
             arrows (bool, optional):
                 Digraph or Graph(no arrows).
                 Defaults to True.
@@ -331,13 +371,18 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
             component_node_color (str, optional):
                 Node color setting information.
                 Defaults to "#FF6600".
+            layout (str, optional):
+                Layout of networkx used when pos is None.
+                "spring" or "shell" is available.
+                Defaults to "spring".
             **kwds:
                 another networkx settings.
         Returns:
             figure: Figure for a network
         """
-        G = G if G is not None else self.get_networkx_graph()
-        pos = pos if pos is not None else nx.spring_layout(G)
+        import networkx as nx
+
+        G, pos = self._get_graph_and_pos(G=G, pos=pos, layout=layout)
         return nx.draw_networkx(
             G,
             pos=pos,
@@ -348,7 +393,12 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
         )
 
     def get_node_and_edge_trace_for_plotly_network(
-        self, G=None, pos=None, node_size=20, component_node_color="#FF6600"
+        self,
+        G=None,
+        pos=None,
+        node_size=20,
+        component_node_color="#FF6600",
+        layout="spring",
     ):
         """
         Get nodes and edges information of plotly network.
@@ -359,20 +409,25 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
                 Defaults to None -> self.get_networkx_graph().
             pos (networkx.layout, optional):
                 Layout of networkx.
-                Defaults to None -> networkx.spring_layout(G).
+                Defaults to None -> layout of G by `layout`.
             node_size (int, optional):
                 Node size setting information.
                 Defaults to 20.
             component_node_color (str, optional):
                 Node color setting information.
                 Defaults to "#FF6600".
+            layout (str, optional):
+                Layout of networkx used when pos is None.
+                "spring" or "shell" is available.
+                Defaults to "spring".
 
         Returns:
             node_trace: Node information of plotly network.
             edge_trace: Edge information of plotly network.
         """
-        G = G if G is not None else self.get_networkx_graph()
-        pos = pos if pos is not None else nx.spring_layout(G)
+        import plotly.graph_objects as go
+
+        G, pos = self._get_graph_and_pos(G=G, pos=pos, layout=layout)
 
         node_trace = go.Scatter(
             x=[],
@@ -383,23 +438,24 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
             marker=dict(color=component_node_color, size=node_size,),
         )
 
-        for node in G.nodes:
-            x, y = pos[node]
-            node_trace["x"] = node_trace["x"] + (x,)
-            node_trace["y"] = node_trace["y"] + (y,)
-            node_trace["text"] = node_trace["text"] + (node,)
+        node_list = list(G.nodes)
+        node_trace["x"] = [pos[node][0] for node in node_list]
+        node_trace["y"] = [pos[node][1] for node in node_list]
+        node_trace["text"] = node_list
 
         edge_trace = go.Scatter(
             x=[], y=[], line=dict(width=1, color="#888"), hoverinfo="none", mode="lines"
         )
 
-        for edge in G.edges:
-            x = edge[0]
-            y = edge[1]
+        edge_x = []
+        edge_y = []
+        for x, y in G.edges:
             xposx, xposy = pos[x]
             yposx, yposy = pos[y]
-            edge_trace["x"] += (xposx, yposx)
-            edge_trace["y"] += (xposy, yposy)
+            edge_x.extend((xposx, yposx))
+            edge_y.extend((xposy, yposy))
+        edge_trace["x"] = edge_x
+        edge_trace["y"] = edge_y
         return node_trace, edge_trace
 
     def draw_plotly_network(
@@ -410,6 +466,7 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
         node_size=20,
         component_node_color="#FF6600",
         save_fig_path=None,
+        layout="spring",
     ):
         """
         Draw plotly network
@@ -420,7 +477,7 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
                 Defaults to None -> self.get_networkx_graph().
             pos (networkx.layout, optional):
                 Layout of networkx.
-                Defaults to None -> networkx.spring_layout(G).
+                Defaults to None -> layout of G by `layout`.
             title (str, optional):
                 Figure title of this network.
                 Defaults to "Product".
@@ -433,6 +490,10 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
             save_fig_path (str, optional):
                 Path of saving figure.
                 Defaults to None.
+            layout (str, optional):
+                Layout of networkx used when pos is None.
+                "spring" or "shell" is available.
+                Defaults to "spring".
 
         Returns:
             figure: Figure for a network
@@ -440,8 +501,9 @@ class BaseProduct(object, metaclass=abc.ABCMeta):
         TODO:
             Saving figure file is not implemented...
         """
-        G = G if G is not None else self.get_networkx_graph()
-        pos = pos if pos is not None else nx.spring_layout(G)
+        import plotly.graph_objects as go
+
+        G, pos = self._get_graph_and_pos(G=G, pos=pos, layout=layout)
         node_trace, edge_trace = self.get_node_and_edge_trace_for_plotly_network(
             G, pos, node_size=node_size, component_node_color=component_node_color
         )
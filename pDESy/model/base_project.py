@@ -486,7 +486,7 @@ class BaseProject(object, metaclass=ABCMeta):
         finally:
             for autotask in autotask_removing_after_simulation:
                 for task, dependency in autotask.output_task_list:
-                    task.input_task_list.remove([autotask, dependency])
+                    task.input_task_list.remove((autotask, dependency))
                 self.workflow.task_list.remove(autotask)
             self.workflow.reverse_dependencies()
 
@@ -538,9 +538,8 @@ class BaseProject(object, metaclass=ABCMeta):
     def __update(self, print_debug=False):
         if print_debug:
             print("UPDATE")
-        self.workflow.check_state(self.time, BaseTaskState.FINISHED)
+        self.workflow.step(self.time, check_working=False)
         self.product.check_removing_placed_factory()
-        self.workflow.check_state(self.time, BaseTaskState.READY)
         self.workflow.update_PERT_data(self.time)
 
     def __allocate_single_task_workers(self, print_debug=False):
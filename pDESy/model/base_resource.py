@@ -5,8 +5,12 @@ import abc
 import uuid
 from enum import IntEnum
 import numpy as np
+from ._fast import _GrowableArray
 from .base_task import BaseTaskState
 
+# States of a task counted as working in get_work_amount_skill_progress()
+_WORKING_STATES = frozenset({BaseTaskState.WORKING, BaseTaskState.WORKING_ADDITIONALLY})
+
 
 class BaseResourceState(IntEnum):
     FREE = 0
@@ -40,11 +44,11 @@ class BaseResource(object, metaclass=abc.ABCMeta):
         workamount_skill_mean_map (Dict[str, float], optional):
             Basic parameter.
             Skill for expressing progress in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         workamount_skill_sd_map (Dict[str, float], optional):
             Basic parameter.
             Standard deviation of skill for expressing progress in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         state (BaseResourceState, optional):
             Basic variable.
             State of this resource in simulation.
@@ -71,6 +75,22 @@ class BaseResource(object, metaclass=abc.ABCMeta):
             Defaults to None -> [].
     """
 
+    __slots__ = (
+        "name",
+        "ID",
+        "team_id",
+        "cost_per_time",
+        "solo_working",
+        "workamount_skill_mean_map",
+        "workamount_skill_sd_map",
+        "state",
+        "cost_list",
+        "start_time_list",
+        "finish_time_list",
+        "assigned_task_list",
+        "assigned_task_id_record",
+    )
+
     def __init__(
         self,
         # Basic parameters
@@ -79,8 +99,8 @@ class BaseResource(object, metaclass=abc.ABCMeta):
         team_id=None,
         cost_per_time=0.0,
         solo_working=False,
-        workamount_skill_mean_map={},
-        workamount_skill_sd_map={},
+        workamount_skill_mean_map=None,
+        workamount_skill_sd_map=None,
         # Basic variables
         state=BaseResourceState.FREE,
         cost_list=None,
@@ -97,10 +117,10 @@ class BaseResource(object, metaclass=abc.ABCMeta):
         self.name = name
         self.ID = ID if ID is not None else str(uuid.uuid4())
         self.team_id = team_id if team_id is not None else None
-        self.cost_per_time = cost_per_time if cost_per_time != 0.0 else 0.0
+        self.cost_per_time = cost_per_time
         self.solo_working = solo_working if solo_working is not None else False
         self.workamount_skill_mean_map = (
-            workamount_skill_mean_map if workamount_skill_mean_map is not {} else {}
+            workamount_skill_mean_map if workamount_skill_mean_map is not None else {}
         )
         self.workamount_skill_sd_map = (
             workamount_skill_sd_map if workamount_skill_sd_map is not None else {}
@@ -116,9 +136,9 @@ class BaseResource(object, metaclass=abc.ABCMeta):
             self.state = BaseResourceState.FREE
 
         if cost_list is not None:
-            self.cost_list = cost_list
+            self.cost_list = _GrowableArray(cost_list)
         else:
-            self.cost_list = []
+            self.cost_list = _GrowableArray()
 
         if start_time_list is not None:
             self.start_time_list = start_time_list
@@ -163,7 +183,7 @@ class BaseResource(object, metaclass=abc.ABCMeta):
         - assigned_task_id_record
         """
         self.state = BaseResourceState.FREE
-        self.cost_list = []
+        self.cost_list = _GrowableArray()
         self.start_time_list = []
         self.finish_time_list = []
         self.assigned_task_list = []
@@ -192,10 +212,8 @@ class BaseResource(object, metaclass=abc.ABCMeta):
         Returns:
             bool: whether he or she has workamount skill of task_name or not
         """
-        if task_name in self.workamount_skill_mean_map:
-            if self.workamount_skill_mean_map[task_name] > 0.0 + error_tol:
-                return True
-        return False
+        skill_mean = self.workamount_skill_mean_map.get(task_name)
+        return skill_mean is not None and skill_mean > 0.0 + error_tol
 
     def get_work_amount_skill_progress(self, task_name, seed=None):
         """
@@ -225,16 +243,12 @@ class BaseResource(object, metaclass=abc.ABCMeta):
         if not self.has_workamount_skill(task_name):
             return 0.0
         skill_mean = self.workamount_skill_mean_map[task_name]
-        if task_name not in self.workamount_skill_sd_map:
-            skill_sd = 0
+        skill_sd = self.workamount_skill_sd_map.get(task_name, 0.0)
+        if skill_sd == 0.0:
+            base_progress = skill_mean
         else:
-            skill_sd = self.workamount_skill_sd_map[task_name]
-        base_progress = np.random.normal(skill_mean, skill_sd)
+            base_progress = np.random.normal(skill_mean, skill_sd)
         sum_of_working_task_in_this_time = sum(
-            map(
-                lambda task: task.state == BaseTaskState.WORKING
-                or task.state == BaseTaskState.WORKING_ADDITIONALLY,
-                self.assigned_task_list,
-            )
+            1 for task in self.assigned_task_list if task.state in _WORKING_STATES
         )
         return base_progress / float(sum_of_working_task_in_this_time)
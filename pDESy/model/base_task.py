@@ -2,9 +2,12 @@
 # -*- coding: utf-8 -*-
 
 import abc
+import bisect
 import uuid
 from enum import IntEnum
 import datetime
+import numpy as np
+from ._fast import _get_datetime_str_list
 
 
 class BaseTaskState(IntEnum):
@@ -22,6 +25,161 @@ class BaseTaskDependency(IntEnum):
     SF = 3  # Finish to Start
 
 
+class _Link(tuple):
+    """_Link
+    (BaseTask, BaseTaskDependency) link in input_task_list or output_task_list.
+    A link is equal to the [BaseTask, BaseTaskDependency] list of the same items,
+    so links can be compared and removed in both forms.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = tuple.__hash__
+
+
+class _LinkList(list):
+    """_LinkList
+    List of (BaseTask, BaseTaskDependency) links used as
+    input_task_list and output_task_list of BaseTask.
+    Every link added to this list is converted to _Link.
+    Every change of this list increments its version,
+    so cached links can be validated without reading all links.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, links=()):
+        super().__init__(map(_Link, links))
+        self.version = 0
+
+    def append(self, link):
+        self.version += 1
+        super().append(_Link(link))
+
+    def extend(self, links):
+        self.version += 1
+        super().extend(map(_Link, links))
+
+    def insert(self, index, link):
+        self.version += 1
+        super().insert(index, _Link(link))
+
+    def remove(self, link):
+        self.version += 1
+        super().remove(link)
+
+    def pop(self, index=-1):
+        self.version += 1
+        return super().pop(index)
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self.version += 1
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self.version += 1
+        super().reverse()
+
+    def __setitem__(self, index, link):
+        self.version += 1
+        if isinstance(index, slice):
+            link = map(_Link, link)
+        else:
+            link = _Link(link)
+        super().__setitem__(index, link)
+
+    def __delitem__(self, index):
+        self.version += 1
+        super().__delitem__(index)
+
+    def __iadd__(self, links):
+        self.version += 1
+        return super().__iadd__(map(_Link, links))
+
+    def __imul__(self, n):
+        self.version += 1
+        return super().__imul__(n)
+
+
+class TaskPool(object):
+    """TaskPool
+    Column-wise storage of the state of tasks.
+    A task registered to this pool reads and writes its state
+    through its index in this array.
+
+    Args:
+        task_list (List[BaseTask], optional):
+            List of BaseTask registered to this pool.
+            Defaults to None -> [].
+    """
+
+    def __init__(self, task_list=None):
+        self.task_list = []
+        self.state = np.zeros(0, dtype=np.int8)
+        # True if a task of this pool was registered to another pool.
+        self.dirty = False
+        # Incremented every time this pool is (re)built.
+        self.version = 0
+        if task_list is not None:
+            self.build(task_list)
+
+    def __len__(self):
+        return len(self.task_list)
+
+    def is_synced(self, task_list):
+        """
+        Check whether this pool has the same tasks as task_list.
+
+        Args:
+            task_list (List[BaseTask]):
+                List of BaseTask
+
+        Returns:
+            bool: whether this pool is up to date or not
+        """
+        return not self.dirty and self.task_list == task_list
+
+    def build(self, task_list):
+        """
+        (Re)build the array of this pool from task_list.
+
+        Args:
+            task_list (List[BaseTask]):
+                List of BaseTask registered to this pool.
+        """
+        # Read the current values before the array is replaced.
+        state = [int(task.state) for task in task_list]
+
+        # Tasks removed from this pool keep their values locally.
+        new_id_set = set(map(id, task_list))
+        for task in self.task_list:
+            if id(task) not in new_id_set and task._pool is self:
+                task._detach_pool()
+
+        self.task_list = list(task_list)
+        self.state = np.array(state, dtype=np.int8)
+        self.dirty = False
+        self.version += 1
+        for idx, task in enumerate(self.task_list):
+            if task._pool is not None and task._pool is not self:
+                task._pool.dirty = True
+            task._pool = self
+            task._idx = idx
+
+
 class BaseTask(object, metaclass=abc.ABCMeta):
     """BaseTask
     BaseTask class for expressing target workflow.
@@ -129,6 +287,41 @@ class BaseTask(object, metaclass=abc.ABCMeta):
             Defaults to None -> [].
     """
 
+    __slots__ = (
+        "name",
+        "ID",
+        "_default_work_amount",
+        "_input_task_list",
+        "_output_task_list",
+        "allocated_team_list",
+        "allocated_factory_list",
+        "need_facility",
+        "target_component",
+        "_default_progress",
+        "_initial_remaining",
+        "due_time",
+        "auto_task",
+        "est",
+        "eft",
+        "lst",
+        "lft",
+        "remaining_work_amount",
+        "_pool",
+        "_idx",
+        "_state",
+        "ready_time_list",
+        "start_time_list",
+        "finish_time_list",
+        "allocated_worker_list",
+        "allocated_worker_id_record",
+        "allocated_facility_list",
+        "allocated_facility_id_record",
+        "_time_record_key",
+        "_ready_arr",
+        "_start_arr",
+        "_finish_arr",
+    )
+
     def __init__(
         self,
         # Basic parameters
@@ -166,9 +359,11 @@ class BaseTask(object, metaclass=abc.ABCMeta):
         # Basic parameter
         self.name = name
         self.ID = ID if ID is not None else str(uuid.uuid4())
-        self.default_work_amount = (
+        self._default_work_amount = (
             default_work_amount if default_work_amount is not None else 10.0
         )
+        self._input_task_list = _LinkList()
+        self._output_task_list = _LinkList()
         self.input_task_list = input_task_list if input_task_list is not None else []
         self.output_task_list = output_task_list if output_task_list is not None else []
         self.allocated_team_list = (
@@ -181,9 +376,13 @@ class BaseTask(object, metaclass=abc.ABCMeta):
         self.target_component = (
             target_component if target_component is not None else None
         )
-        self.default_progress = (
+        self._default_progress = (
             default_progress if default_progress is not None else 0.0
         )
+        # Remaining work amount just after initialize()
+        self._initial_remaining = self._default_work_amount * (
+            1.0 - self._default_progress
+        )
         self.due_time = due_time if due_time is not None else int(-1)
         self.auto_task = auto_task if auto_task is not False else False
         # ----
@@ -197,10 +396,10 @@ class BaseTask(object, metaclass=abc.ABCMeta):
         if remaining_work_amount is not None:
             self.remaining_work_amount = remaining_work_amount
         else:
-            self.remaining_work_amount = self.default_work_amount * (
-                1.0 - self.default_progress
-            )
+            self.remaining_work_amount = self._initial_remaining
 
+        self._pool = None
+        self._idx = None
         if state is not BaseTaskState.NONE:
             self.state = state
         else:
@@ -241,6 +440,82 @@ class BaseTask(object, metaclass=abc.ABCMeta):
         else:
             self.allocated_facility_id_record = []
 
+        # Cache of time records for get_states_from_record
+        self._time_record_key = None
+        self._ready_arr = None
+        self._start_arr = None
+        self._finish_arr = None
+
+    @property
+    def default_work_amount(self):
+        return self._default_work_amount
+
+    @default_work_amount.setter
+    def default_work_amount(self, default_work_amount):
+        self._default_work_amount = default_work_amount
+        self._initial_remaining = default_work_amount * (1.0 - self._default_progress)
+
+    @property
+    def default_progress(self):
+        return self._default_progress
+
+    @default_progress.setter
+    def default_progress(self, default_progress):
+        self._default_progress = default_progress
+        self._initial_remaining = self._default_work_amount * (1.0 - default_progress)
+
+    @property
+    def input_task_list(self):
+        return self._input_task_list
+
+    @input_task_list.setter
+    def input_task_list(self, input_task_list):
+        # Assigned list is copied to _LinkList for tracking its changes.
+        if not isinstance(input_task_list, _LinkList):
+            input_task_list = _LinkList(input_task_list)
+        # Version of the new list continues from the replaced one.
+        input_task_list.version = (
+            max(input_task_list.version, self._input_task_list.version) + 1
+        )
+        self._input_task_list = input_task_list
+
+    @property
+    def output_task_list(self):
+        return self._output_task_list
+
+    @output_task_list.setter
+    def output_task_list(self, output_task_list):
+        # Assigned list is copied to _LinkList for tracking its changes.
+        if not isinstance(output_task_list, _LinkList):
+            output_task_list = _LinkList(output_task_list)
+        # Version of the new list continues from the replaced one.
+        output_task_list.version = (
+            max(output_task_list.version, self._output_task_list.version) + 1
+        )
+        self._output_task_list = output_task_list
+
+    @property
+    def state(self):
+        if self._pool is None:
+            return self._state
+        return BaseTaskState(int(self._pool.state[self._idx]))
+
+    @state.setter
+    def state(self, state):
+        if self._pool is None:
+            self._state = state
+        else:
+            self._pool.state[self._idx] = state
+
+    def _detach_pool(self):
+        """
+        Move state from TaskPool to this task.
+        """
+        state = self.state
+        self._pool = None
+        self._idx = None
+        self.state = state
+
     def __str__(self):
         """
         Returns:
@@ -274,8 +549,8 @@ class BaseTask(object, metaclass=abc.ABCMeta):
             ['task']
         """
 
-        self.input_task_list.append([input_task, task_dependency_mode])
-        input_task.output_task_list.append([self, task_dependency_mode])
+        self.input_task_list.append((input_task, task_dependency_mode))
+        input_task.output_task_list.append((self, task_dependency_mode))
 
     def extend_input_task_list(
         self, input_task_list, task_dependency_mode=BaseTaskDependency.FS
@@ -300,8 +575,8 @@ class BaseTask(object, metaclass=abc.ABCMeta):
             ['task']
         """
         for input_task in input_task_list:
-            self.input_task_list.append([input_task, task_dependency_mode])
-            input_task.output_task_list.append([self, task_dependency_mode])
+            self.input_task_list.append((input_task, task_dependency_mode))
+            input_task.output_task_list.append((self, task_dependency_mode))
 
     def initialize(self, error_tol=1e-10):
         """
@@ -325,9 +600,7 @@ class BaseTask(object, metaclass=abc.ABCMeta):
         self.eft = 0.0  # Earliest finish time
         self.lst = -1.0  # Latest start time
         self.lft = -1.0  # Latest finish time
-        self.remaining_work_amount = self.default_work_amount * (
-            1.0 - self.default_progress
-        )
+        self.remaining_work_amount = self._initial_remaining
         self.state = BaseTaskState.NONE
         self.ready_time_list = []
         self.start_time_list = []
@@ -397,47 +670,38 @@ class BaseTask(object, metaclass=abc.ABCMeta):
         """
         Judge whether this task can be assigned another resources or not
         """
-        if self.state == BaseTaskState.NONE:
-            return False
-        elif self.state == BaseTaskState.FINISHED:
+        state = self.state
+        if state == BaseTaskState.NONE or state == BaseTaskState.FINISHED:
             return False
 
-        # True if none of the allocated resources have solo_working attribute True.
-        for w in self.allocated_worker_list:
-            if w.solo_working:
-                return False
-        for f in self.allocated_facility_list:
-            if f.solo_working:
-                return False
+        # False if one of the allocated resources has solo_working attribute True.
+        if any(w.solo_working for w in self.allocated_worker_list) or any(
+            f.solo_working for f in self.allocated_facility_list
+        ):
+            return False
 
         # solo_working check
-        if worker is not None:
-            if worker.solo_working:
-                if len(self.allocated_worker_list) > 0:
-                    return False
-        if facility is not None:
-            if facility.solo_working:
-                if len(self.allocated_facility_list) > 0:
-                    return False
+        if (
+            worker is not None
+            and worker.solo_working
+            and len(self.allocated_worker_list) > 0
+        ):
+            return False
+        if (
+            facility is not None
+            and facility.solo_working
+            and len(self.allocated_facility_list) > 0
+        ):
+            return False
 
         # skill check
         if facility is not None:
-            if facility.has_workamount_skill(self.name):
-                if worker.has_facility_skill(
-                    facility.name
-                ) and worker.has_workamount_skill(self.name):
-                    return True
-                else:
-                    return False
-            else:
-                return False
-        elif worker is not None:
-            if worker.has_workamount_skill(self.name):
-                return True
-            else:
-                return False
-        else:
-            return False
+            return (
+                facility.has_workamount_skill(self.name)
+                and worker.has_facility_skill(facility.name)
+                and worker.has_workamount_skill(self.name)
+            )
+        return worker is not None and worker.has_workamount_skill(self.name)
 
     def record_allocated_workers_facilities_id(self):
         """
@@ -450,6 +714,28 @@ class BaseTask(object, metaclass=abc.ABCMeta):
             [facility.ID for facility in self.allocated_facility_list]
         )
 
+    def __get_time_record_arrays(self):
+        """
+        Get ready_time_list, start_time_list and finish_time_list as numpy.ndarray.
+        The arrays are cached until these lists are replaced or appended.
+        """
+        record_list = (
+            self.ready_time_list,
+            self.start_time_list,
+            self.finish_time_list,
+        )
+        key = self._time_record_key
+        if (
+            key is None
+            or any(a is not b for a, b in zip(key[0], record_list))
+            or key[1] != tuple(len(r) for r in record_list)
+        ):
+            self._ready_arr, self._start_arr, self._finish_arr = (
+                np.asarray(r, dtype=np.float64) for r in record_list
+            )
+            self._time_record_key = (record_list, tuple(len(r) for r in record_list))
+        return self._ready_arr, self._start_arr, self._finish_arr
+
     def get_state_from_record(self, time: int):
         """
         Get the state information in time
@@ -461,36 +747,35 @@ class BaseTask(object, metaclass=abc.ABCMeta):
         Returns:
             BaseTaskState: Task State information.
         """
-
-        if time < self.ready_time_list[0]:
+        # Number of READY, WORKING and FINISHED events until time
+        n_ready = bisect.bisect_right(self.ready_time_list, time)
+        if n_ready == 0:
             return BaseTaskState.NONE
-        elif self.ready_time_list[0] <= time and time < self.start_time_list[0]:
-            return BaseTaskState.READY
-        elif self.start_time_list[0] <= time and time < self.finish_time_list[0]:
+        if bisect.bisect_right(self.finish_time_list, time) == n_ready:
+            return BaseTaskState.FINISHED
+        if bisect.bisect_right(self.start_time_list, time) == n_ready:
             return BaseTaskState.WORKING
-        else:
-            if len(self.finish_time_list) == 1:
-                return BaseTaskState.FINISHED
-            else:
-                for i in range(len(self.finish_time_list) - 1):
-                    if (
-                        self.finish_time_list[i] <= time
-                        and time < self.ready_time_list[i + 1]
-                    ):
-                        return BaseTaskState.FINISHED
-                    elif (
-                        self.ready_time_list[i + 1] <= time
-                        and time < self.start_time_list[i + 1]
-                    ):
-                        return BaseTaskState.READY
-                    elif (
-                        self.start_time_list[i + 1] <= time
-                        and time < self.finish_time_list[i + 1]
-                    ):
-                        return BaseTaskState.WORKING
-
-                if self.finish_time_list[-1] <= time:
-                    return BaseTaskState.FINISHED
+        return BaseTaskState.READY
+
+    def get_states_from_record(self, time_array):
+        """
+        Get the state information in each time of time_array.
+
+        Args:
+            time_array (numpy.ndarray):
+                target simulation times
+
+        Returns:
+            numpy.ndarray: Value of BaseTaskState in each time.
+        """
+        ready_arr, start_arr, finish_arr = self.__get_time_record_arrays()
+        # Number of READY, WORKING and FINISHED events until each time
+        n_ready = np.searchsorted(ready_arr, time_array, side="right")
+        n_start = np.searchsorted(start_arr, time_array, side="right")
+        n_finish = np.searchsorted(finish_arr, time_array, side="right")
+        state = np.where(n_start == n_ready, BaseTaskState.WORKING, BaseTaskState.READY)
+        state = np.where(n_finish == n_ready, BaseTaskState.FINISHED, state)
+        return np.where(n_ready == 0, BaseTaskState.NONE, state)
 
     def create_data_for_gantt_plotly(
         self,
@@ -518,36 +803,71 @@ class BaseTask(object, metaclass=abc.ABCMeta):
         Returns:
             list[dict]: Gantt plotly information of this BaseTask
         """
-        df = []
-        for ready_time, start_time, finish_time in zip(
-            self.ready_time_list, self.start_time_list, self.finish_time_list
-        ):
-            if view_ready:
-                df.append(
-                    dict(
-                        Task=self.name,
-                        Start=(init_datetime + ready_time * unit_timedelta).strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        ),
-                        Finish=(init_datetime + (start_time) * unit_timedelta).strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        ),
-                        State="READY",
-                        Type="Task",
-                    )
-                )
-
-            df.append(
-                dict(
-                    Task=self.name,
-                    Start=(init_datetime + start_time * unit_timedelta).strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    ),
-                    Finish=(
-                        init_datetime + (finish_time + finish_margin) * unit_timedelta
-                    ).strftime("%Y-%m-%d %H:%M:%S"),
-                    State="WORKING",
-                    Type="Task",
-                )
-            )
-        return df
+        return _create_data_for_gantt_plotly(
+            [self],
+            init_datetime,
+            unit_timedelta,
+            finish_margin=finish_margin,
+            view_ready=view_ready,
+        )
+
+
+def _create_data_for_gantt_plotly(
+    task_list, init_datetime, unit_timedelta, finish_margin=1.0, view_ready=False
+):
+    """
+    Create data for gantt plotly of all BaseTasks in task_list.
+    Datetime strings of all intervals are calculated at once by numpy.
+    """
+    name_list, ready_time_list, start_time_list, finish_time_list = [], [], [], []
+    for task in task_list:
+        n_interval = min(
+            len(task.ready_time_list),
+            len(task.start_time_list),
+            len(task.finish_time_list),
+        )
+        name_list.extend([task.name] * n_interval)
+        ready_time_list.extend(task.ready_time_list[:n_interval])
+        start_time_list.extend(task.start_time_list[:n_interval])
+        finish_time_list.extend(task.finish_time_list[:n_interval])
+
+    start_list = _get_datetime_str_list(init_datetime, unit_timedelta, start_time_list)
+    finish_list = _get_datetime_str_list(
+        init_datetime,
+        unit_timedelta,
+        np.asarray(finish_time_list, dtype=np.float64) + finish_margin,
+    )
+    if view_ready:
+        ready_list = _get_datetime_str_list(
+            init_datetime, unit_timedelta, ready_time_list
+        )
+
+    # Rows are built from columns. With view_ready, READY row of each interval
+    # is put just before its WORKING row.
+    n_row_per_interval = 2 if view_ready else 1
+    task_column = [name for name in name_list for _ in range(n_row_per_interval)]
+    state_column = (["READY", "WORKING"] if view_ready else ["WORKING"]) * len(
+        name_list
+    )
+    if view_ready:
+        start_column = _interleave(ready_list, start_list)
+        finish_column = _interleave(start_list, finish_list)
+    else:
+        start_column, finish_column = start_list, finish_list
+
+    return [
+        {"Task": name, "Start": start, "Finish": finish, "State": state, "Type": "Task"}
+        for name, start, finish, state in zip(
+            task_column, start_column, finish_column, state_column
+        )
+    ]
+
+
+def _interleave(first_list, second_list):
+    """
+    Get [first_list[0], second_list[0], first_list[1], second_list[1], ...].
+    """
+    interleaved_list = [None] * (len(first_list) + len(second_list))
+    interleaved_list[0::2] = first_list
+    interleaved_list[1::2] = second_list
+    return interleaved_list
@@ -7,6 +7,8 @@ from .base_resource import BaseResourceState
 import plotly.graph_objects as go
 import plotly.figure_factory as ff
 import datetime
+import numpy as np
+from ._fast import _GrowableArray, _get_datetime_str_list
 
 
 class BaseTeam(object, metaclass=abc.ABCMeta):
@@ -74,9 +76,9 @@ class BaseTeam(object, metaclass=abc.ABCMeta):
         # --
         # Basic variables
         if cost_list is not None:
-            self.cost_list = cost_list
+            self.cost_list = _GrowableArray(cost_list)
         else:
-            self.cost_list = []
+            self.cost_list = _GrowableArray()
 
     def set_parent_team(self, parent_team):
         """
@@ -151,7 +153,7 @@ class BaseTeam(object, metaclass=abc.ABCMeta):
         - cost_list
         - changeable variable of BaseWorker in worker_list
         """
-        self.cost_list = []
+        self.cost_list = _GrowableArray()
         for w in self.worker_list:
             w.initialize()
 
@@ -343,12 +345,11 @@ class BaseTeam(object, metaclass=abc.ABCMeta):
             data (List[go.Bar(name, x, y)]: Information of cost history chart.
         """
         data = []
-        x = [
-            (init_datetime + time * unit_timedelta).strftime("%Y-%m-%d %H:%M:%S")
-            for time in range(len(self.cost_list))
-        ]
+        x = _get_datetime_str_list(
+            init_datetime, unit_timedelta, np.arange(len(self.cost_list))
+        )
         for worker in self.worker_list:
-            data.append(go.Bar(name=worker.name, x=x, y=worker.cost_list))
+            data.append(go.Bar(name=worker.name, x=x, y=list(worker.cost_list)))
         return data
 
     def create_cost_history_plotly(
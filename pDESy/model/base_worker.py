@@ -32,15 +32,15 @@ class BaseWorker(BaseResource):
         workamount_skill_mean_map (Dict[str, float], optional):
             Basic parameter.
             Skill for expressing progress in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         workamount_skill_sd_map (Dict[str, float], optional):
             Basic parameter.
             Standard deviation of skill for expressing progress in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         facility_skill_map (Dict[str, float], optional):
             Basic parameter.
             Skill for operating facility in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         state (BaseResourceState, optional):
             Basic variable.
             State of this resource in simulation.
@@ -67,6 +67,8 @@ class BaseWorker(BaseResource):
             Defaults to None -> [].
     """
 
+    __slots__ = ("facility_skill_map",)
+
     def __init__(
         self,
         # Basic parameters
@@ -75,9 +77,9 @@ class BaseWorker(BaseResource):
         team_id=None,
         cost_per_time=0.0,
         solo_working=False,
-        workamount_skill_mean_map={},
-        workamount_skill_sd_map={},
-        facility_skill_map={},
+        workamount_skill_mean_map=None,
+        workamount_skill_sd_map=None,
+        facility_skill_map=None,
         # Basic variables
         state=BaseResourceState.FREE,
         cost_list=None,
@@ -121,7 +123,5 @@ class BaseWorker(BaseResource):
         Returns:
             bool: whether he or she has workamount skill of task_name or not
         """
-        if facility_name in self.facility_skill_map:
-            if self.facility_skill_map[facility_name] > 0.0 + error_tol:
-                return True
-        return False
+        skill_point = self.facility_skill_map.get(facility_name)
+        return skill_point is not None and skill_point > 0.0 + error_tol
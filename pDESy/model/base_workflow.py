@@ -3,13 +3,12 @@
 
 import abc
 from typing import List
-from .base_task import BaseTask, BaseTaskState, BaseTaskDependency
+from .base_task import BaseTask, BaseTaskState, BaseTaskDependency, TaskPool
+from .base_task import _create_data_for_gantt_plotly
 from .base_resource import BaseResourceState
-import plotly.figure_factory as ff
-import networkx as nx
-import plotly.graph_objects as go
 import datetime
-import matplotlib.pyplot as plt
+import numpy as np
+from ._fast import _add_bar_collection, _get_layout
 
 
 class BaseWorkflow(object, metaclass=abc.ABCMeta):
@@ -28,6 +27,23 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
             Defaults to 0.0.
     """
 
+    __slots__ = (
+        "task_list",
+        "_task_pool",
+        "critical_path_length",
+        "_dependency_cache_key",
+        "_link_src",
+        "_link_dst",
+        "_link_dependency",
+        "_input_link_list",
+        "_output_link_list",
+        "_graph_version",
+        "_graph_cache",
+        "_graph_cache_version",
+        "_pos_cache",
+        "_pert_cache",
+    )
+
     def __init__(
         self,
         # Basic parameters
@@ -40,6 +56,7 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
         # --
         # Basic parameter
         self.task_list = task_list
+        self._task_pool = TaskPool(self.task_list)
 
         # ----
         # Changeable variable on simulation
@@ -49,6 +66,21 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
             critical_path_length if critical_path_length != 0.0 else 0.0
         )
 
+        # Cache of dependency links for checking state and PERT calculation
+        self._dependency_cache_key = None
+        self._link_src = None
+        self._link_dst = None
+        self._link_dependency = None
+        self._input_link_list = None
+        self._output_link_list = None
+        # Structural version of the cached links and cache of networkx graph
+        self._graph_version = 0
+        self._graph_cache = None
+        self._graph_cache_version = None
+        self._pos_cache = {}
+        # Inputs and results of the last PERT calculation
+        self._pert_cache = None
+
     def __str__(self):
         """
         Returns:
@@ -60,6 +92,18 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
         """
         return "{}".format(list(map(lambda task: str(task), self.task_list)))
 
+    def get_task_pool(self):
+        """
+        Get TaskPool of task_list.
+        TaskPool is rebuilt if task_list was changed directly.
+
+        Returns:
+            TaskPool: TaskPool of this workflow
+        """
+        if not self._task_pool.is_synced(self.task_list):
+            self._task_pool.build(self.task_list)
+        return self._task_pool
+
     def initialize(self):
         """
         Initialize the changeable variables of BaseWorkflow including PERT calculation.
@@ -85,8 +129,43 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
             time (int):
                 Simulation time.
         """
-        self.__set_est_eft_data(time)
-        self.__set_lst_lft_criticalpath_data(time)
+        self.__update_dependency_cache()
+        work = np.array(
+            [task.remaining_work_amount for task in self.task_list], dtype=np.float64
+        )
+        eft = np.array([task.eft for task in self.task_list], dtype=np.float64)
+        lst = np.array([task.lst for task in self.task_list], dtype=np.float64)
+        lft = np.array([task.lft for task in self.task_list], dtype=np.float64)
+        self.__set_PERT_data(time, work, eft, lst, lft)
+
+    def __set_PERT_data(self, time, work, eft, lst, lft):
+        # PERT data is reused if the structure and all inputs are not changed
+        # (e.g. initialize() of the same workflow).
+        key = (
+            self._graph_version,
+            time,
+            work.tobytes(),
+            eft.tobytes(),
+            lst.tobytes(),
+            lft.tobytes(),
+        )
+        if self._pert_cache is not None and self._pert_cache[0] == key:
+            est, eft, lst, lft, critical_path_length = self._pert_cache[1:]
+        else:
+            est, eft = self.__get_est_eft_array(time, work, eft)
+            lst, lft, critical_path_length = self.__get_lst_lft_array(
+                work, eft, lst, lft
+            )
+            self._pert_cache = (key, est, eft, lst, lft, critical_path_length)
+
+        self.critical_path_length = critical_path_length
+        for task, task_est, task_eft, task_lst, task_lft in zip(
+            self.task_list, est.tolist(), eft.tolist(), lst.tolist(), lft.tolist()
+        ):
+            task.est = task_est
+            task.eft = task_eft
+            task.lst = task_lst
+            task.lft = task_lft
 
     def check_state(self, time: int, state: BaseTaskState):
         """
@@ -99,132 +178,164 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
                 Check target state.
                 Search and update all tasks which can change only target state.
         """
+        self.__update_dependency_cache()
+        task_state = self.get_task_pool().state
         if state == BaseTaskState.READY:
-            self.__check_ready(time)
+            self.__check_ready(time, task_state)
         elif state == BaseTaskState.WORKING:
-            self.__check_working(time)
+            self.__check_working(time, task_state)
         elif state == BaseTaskState.FINISHED:
-            self.__check_finished(time)
+            self.__check_finished(time, task_state)
+
+    def step(self, time: int, check_working=True):
+        """
+        Check FINISHED, READY and WORKING state of all BaseTasks in task_list
+        in this order. This is equal to calling check_state for each state,
+        but the dependency links and the pool of states are validated only once.
 
-    def __check_ready(self, time: int):
-        none_task_list = list(
-            filter(lambda task: task.state == BaseTaskState.NONE, self.task_list)
+        Args:
+            time (int):
+                Simulation time
+            check_working (bool, optional):
+                Whether to check WORKING state or not.
+                Set False when resources are allocated after READY check.
+                Defaults to True.
+        """
+        self.__update_dependency_cache()
+        state = self.get_task_pool().state
+        self.__check_finished(time, state)
+        self.__check_ready(time, state)
+        if check_working:
+            self.__check_working(time, state)
+
+    def __check_ready(self, time: int, state):
+        # check READY condition by each dependency
+        # FS: if input task is finished
+        # SS: if input task is started
+        # ...or this is head task
+        # Tasks not in task_list are regarded as NONE.
+        input_state = np.append(state, BaseTaskState.NONE)[self._link_src]
+        dependency = self._link_dependency
+        not_ready_link = (
+            (dependency == BaseTaskDependency.FS)
+            & (input_state != BaseTaskState.FINISHED)
+        ) | (
+            (dependency == BaseTaskDependency.SS)
+            & (input_state != BaseTaskState.WORKING)
         )
-        for none_task in none_task_list:
-            input_task_list = none_task.input_task_list
-
-            # check READY condition by each dependency
-            # FS: if input task is finished
-            # SS: if input task is started
-            # ...or this is head task
-            ready = True
-            for input_task, dependency in input_task_list:
-                if dependency == BaseTaskDependency.FS:
-                    if input_task.state == BaseTaskState.FINISHED:
-                        ready = True
-                    else:
-                        ready = False
-                        break
-                elif dependency == BaseTaskDependency.SS:
-                    if input_task.state == BaseTaskState.WORKING:
-                        ready = True
-                    else:
-                        ready = False
-                        break
-                elif dependency == BaseTaskDependency.SF:
-                    pass
-                elif dependency == BaseTaskDependency.FF:
-                    pass
-            if ready:
-                none_task.state = BaseTaskState.READY
-                none_task.ready_time_list.append(time)
-
-    def __check_working(self, time: int):
-        ready_and_assigned_task_list = list(
-            filter(
-                lambda task: task.state == BaseTaskState.READY
-                and len(task.allocated_worker_list) > 0,
-                self.task_list,
-            )
+        n_not_ready_link = np.bincount(
+            self._link_dst[not_ready_link], minlength=len(self.task_list)
         )
-
-        ready_auto_task_list = list(
-            filter(
-                lambda task: task.state == BaseTaskState.READY and task.auto_task,
-                self.task_list,
-            )
+        ready = (state == BaseTaskState.NONE) & (n_not_ready_link == 0)
+        for i in np.flatnonzero(ready).tolist():
+            none_task = self.task_list[i]
+            none_task.state = BaseTaskState.READY
+            none_task.ready_time_list.append(time)
+
+    def __check_working(self, time: int, state):
+        candidate_index = np.flatnonzero(
+            (state == BaseTaskState.READY) | (state == BaseTaskState.WORKING)
         )
-
-        working_and_assigned_task_list = list(
-            filter(
-                lambda task: task.state == BaseTaskState.WORKING
-                and len(task.allocated_worker_list) > 0,
-                self.task_list,
-            )
+        candidate_task_list = [self.task_list[i] for i in candidate_index.tolist()]
+        has_worker = np.array(
+            [len(task.allocated_worker_list) > 0 for task in candidate_task_list],
+            dtype=bool,
         )
-
-        target_task_list = []
-        target_task_list.extend(ready_and_assigned_task_list)
-        target_task_list.extend(ready_auto_task_list)
-        target_task_list.extend(working_and_assigned_task_list)
-
-        for task in target_task_list:
-            if task.state == BaseTaskState.READY:
-                task.state = BaseTaskState.WORKING
-                task.start_time_list.append(time)
-                for worker in task.allocated_worker_list:
+        is_auto_task = np.array(
+            [task.auto_task for task in candidate_task_list], dtype=bool
+        )
+        candidate_state = state[candidate_index]
+        ready = candidate_state == BaseTaskState.READY
+        # Assigned tasks start before auto tasks without workers.
+        starting_index = np.concatenate(
+            [
+                np.flatnonzero(ready & has_worker),
+                np.flatnonzero(ready & ~has_worker & is_auto_task),
+            ]
+        )
+        working_and_assigned = (candidate_state == BaseTaskState.WORKING) & has_worker
+
+        # READY -> WORKING
+        state[candidate_index[starting_index]] = BaseTaskState.WORKING
+        for i in starting_index.tolist():
+            task = candidate_task_list[i]
+            task.start_time_list.append(time)
+            for worker in task.allocated_worker_list:
+                worker.state = BaseResourceState.WORKING
+                worker.start_time_list.append(time)
+                worker.assigned_task_list.append(task)
+            if task.need_facility:
+                for facility in task.allocated_facility_list:
+                    facility.state = BaseResourceState.WORKING
+                    facility.start_time_list.append(time)
+                    facility.assigned_task_list.append(task)
+
+        # WORKING task with newly allocated resources
+        for i in np.flatnonzero(working_and_assigned).tolist():
+            task = candidate_task_list[i]
+            for worker in task.allocated_worker_list:
+                if worker.state == BaseResourceState.FREE:
                     worker.state = BaseResourceState.WORKING
                     worker.start_time_list.append(time)
                     worker.assigned_task_list.append(task)
                 if task.need_facility:
                     for facility in task.allocated_facility_list:
-                        facility.state = BaseResourceState.WORKING
-                        facility.start_time_list.append(time)
-                        facility.assigned_task_list.append(task)
-
-            elif task.state == BaseTaskState.WORKING:
-                for worker in task.allocated_worker_list:
-                    if worker.state == BaseResourceState.FREE:
-                        worker.state = BaseResourceState.WORKING
-                        worker.start_time_list.append(time)
-                        worker.assigned_task_list.append(task)
-                    if task.need_facility:
-                        for facility in task.allocated_facility_list:
-                            if facility.state == BaseResourceState.FREE:
-                                facility.state = BaseResourceState.WORKING
-                                facility.start_time_list.append(time)
-                                facility.assigned_task_list.append(task)
-
-    def __check_finished(self, time: int, error_tol=1e-10):
-        working_and_zero_task_list = list(
-            filter(
-                lambda task: task.state == BaseTaskState.WORKING
-                and task.remaining_work_amount < 0.0 + error_tol,
-                self.task_list,
-            )
+                        if facility.state == BaseResourceState.FREE:
+                            facility.state = BaseResourceState.WORKING
+                            facility.start_time_list.append(time)
+                            facility.assigned_task_list.append(task)
+
+    def __check_finished(self, time: int, state, error_tol=1e-10):
+        working_and_zero_task_index = [
+            i
+            for i in np.flatnonzero(state == BaseTaskState.WORKING).tolist()
+            if self.task_list[i].remaining_work_amount < 0.0 + error_tol
+        ]
+        if len(working_and_zero_task_index) == 0:
+            return
+
+        # check FINISH condition by each dependency
+        # SF: if input task is working
+        # FF: if input task is finished
+        n_task = len(self.task_list)
+        is_target = np.zeros(n_task + 1, dtype=bool)
+        is_target[working_and_zero_task_index] = True
+        src, dst, dependency = self._link_src, self._link_dst, self._link_dependency
+        link = is_target[dst] & (
+            (dependency == BaseTaskDependency.SF)
+            | (dependency == BaseTaskDependency.FF)
         )
-        for task in working_and_zero_task_list:
-            # check FINISH condition by each dependency
-            # SF: if input task is working
-            # FF: if input task is finished
-            finished = True
-            for input_task, dependency in task.input_task_list:
-                if dependency == BaseTaskDependency.FS:
-                    pass
-                elif dependency == BaseTaskDependency.SS:
-                    pass
-                elif dependency == BaseTaskDependency.SF:
-                    if input_task.state == BaseTaskState.WORKING:
-                        finished = True
-                    else:
-                        finished = False
-                        break
-                elif dependency == BaseTaskDependency.FF:
-                    if input_task.state == BaseTaskState.FINISHED:
-                        finished = True
-                    else:
-                        finished = False
-                        break
+        src, dst, dependency = src[link], dst[link], dependency[link]
+        # Tasks not in task_list are regarded as NONE.
+        input_state = np.append(state, BaseTaskState.NONE)[src]
+        satisfied = np.where(
+            dependency == BaseTaskDependency.FF,
+            input_state == BaseTaskState.FINISHED,
+            input_state == BaseTaskState.WORKING,
+        )
+        n_unsatisfied_link = np.bincount(dst[~satisfied], minlength=n_task)
+        # The condition of a task can be changed in this loop
+        # only if its input task is checked and finished before it.
+        changeable = (
+            np.bincount(dst[is_target[src] & (src < dst)], minlength=n_task) > 0
+        )
+
+        for i in working_and_zero_task_index:
+            task = self.task_list[i]
+            if not changeable[i]:
+                finished = n_unsatisfied_link[i] == 0
+            else:
+                finished = all(
+                    j >= 0
+                    and (
+                        state[j] == BaseTaskState.FINISHED
+                        if dependency == BaseTaskDependency.FF
+                        else state[j] == BaseTaskState.WORKING
+                    )
+                    for j, dependency in self._input_link_list[i]
+                    if dependency == BaseTaskDependency.SF
+                    or dependency == BaseTaskDependency.FF
+                )
             if finished:
                 task.state = BaseTaskState.FINISHED
                 task.finish_time_list.append(time)
@@ -260,98 +371,225 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
 
                     task.allocated_facility_list = []
 
-    def __set_est_eft_data(self, time: int):
-
-        input_task_list = []
+    def __update_dependency_cache(self):
+        """
+        Update the cached arrays of all dependency links in task_list.
+        The arrays are rebuilt only when task_list or any list of links
+        (input_task_list or output_task_list of any BaseTask) has been changed.
+        Tasks linked but not in task_list get index -1 in the lists of links
+        and index len(task_list) in the arrays of links.
+        They are never simulated here, so their links are never satisfied.
+        """
+        # Versions of link lists only increase, so their sum changes
+        # every time one of them is changed.
+        key = (
+            self.get_task_pool().version,
+            sum(
+                task._input_task_list.version + task._output_task_list.version
+                for task in self.task_list
+            ),
+        )
+        if self._dependency_cache_key == key:
+            return
+
+        n_task = len(self.task_list)
+        task_index = {id(task): i for i, task in enumerate(self.task_list)}
+        self._input_link_list = [
+            [
+                (task_index.get(id(input_task), -1), int(dependency))
+                for input_task, dependency in task.input_task_list
+            ]
+            for task in self.task_list
+        ]
+        # Output links keep the order of output_task_list for PERT calculation.
+        self._output_link_list = [
+            [
+                (task_index.get(id(output_task), -1), int(dependency))
+                for output_task, dependency in task.output_task_list
+            ]
+            for task in self.task_list
+        ]
+        # Links are sorted by index of output task (CSR of input tasks).
+        link_list = [
+            (j if j >= 0 else n_task, i, dependency)
+            for i, input_link_list in enumerate(self._input_link_list)
+            for j, dependency in input_link_list
+        ]
+        link_array = np.array(link_list, dtype=np.int32).reshape(-1, 3)
+        self._link_src = link_array[:, 0].copy()
+        self._link_dst = link_array[:, 1].copy()
+        self._link_dependency = link_array[:, 2].astype(np.int8)
+        self._dependency_cache_key = key
+        self._graph_version += 1
+
+    def __get_est_eft_array(self, time, work, eft):
+        """
+        Get est and eft of all tasks from remaining work amount.
+        Tasks are visited in the same order as BaseTask objects are
+        visited in breadth-first search from head tasks,
+        but on lists of floats indexed by position in task_list.
+        """
+        n_task = len(self.task_list)
+        output_link_list = self._output_link_list
+        work = work.tolist()
+        eft = eft.tolist()
 
         # 1. Set the earliest finish time of head tasks.
-        for task in self.task_list:
-            task.est = time
-            if len(task.input_task_list) == 0:
-                task.eft = time + task.remaining_work_amount
-                input_task_list.append(task)
+        est = [time] * n_task
+        input_index_list = []
+        for i, input_link_list in enumerate(self._input_link_list):
+            if len(input_link_list) == 0:
+                eft[i] = time + work[i]
+                input_index_list.append(i)
 
         # 2. Calculate PERT information of all tasks
-        while len(input_task_list) > 0:
-            next_task_list = []
-            for input_task in input_task_list:
-                for next_task, dependency in input_task.output_task_list:
-                    pre_est = next_task.est
-                    est = 0
-                    eft = 0
-                    if dependency == BaseTaskDependency.FS:
-                        est = input_task.est + input_task.remaining_work_amount
-                        eft = est + next_task.remaining_work_amount
-                    elif dependency == BaseTaskDependency.SS:
-                        est = input_task.est + 0
-                        eft = est + next_task.remaining_work_amount
+        while len(input_index_list) > 0:
+            next_index_list = []
+            for i in input_index_list:
+                for j, dependency in output_link_list[i]:
+                    if j < 0:
+                        continue
+                    if dependency == BaseTaskDependency.SS:
+                        link_est = est[i]
+                        link_eft = link_est + work[j]
                     elif dependency == BaseTaskDependency.FF:
-                        est = input_task.est + 0
-                        eft = est + next_task.remaining_work_amount
-                        if input_task.eft > eft:
-                            eft = input_task.eft
+                        link_est = est[i]
+                        link_eft = link_est + work[j]
+                        if eft[i] > link_eft:
+                            link_eft = eft[i]
                     elif dependency == BaseTaskDependency.SF:
-                        est = input_task.est + 0
-                        eft = est + next_task.remaining_work_amount
-                        if input_task.est > eft:
-                            eft = input_task.est
+                        link_est = est[i]
+                        link_eft = link_est + work[j]
+                        if est[i] > link_eft:
+                            link_eft = est[i]
                     else:
-                        est = input_task.est + input_task.remaining_work_amount
-                        eft = est + next_task.remaining_work_amount
-                    if est >= pre_est:
-                        next_task.est = est
-                        next_task.eft = eft
-                    next_task_list.append(next_task)
+                        link_est = est[i] + work[i]
+                        link_eft = link_est + work[j]
+                    if link_est >= est[j]:
+                        est[j] = link_est
+                        eft[j] = link_eft
+                    next_index_list.append(j)
+            input_index_list = next_index_list
 
-            input_task_list = next_task_list
+        return np.array(est, dtype=np.float64), np.array(eft, dtype=np.float64)
 
-    def __set_lst_lft_criticalpath_data(self, time: int):
+    def __get_lst_lft_array(self, work, eft, lst, lft):
+        """
+        Get lst, lft of all tasks and critical path length
+        from remaining work amount and eft.
+        Tasks are visited in the same order as BaseTask objects are
+        visited in breadth-first search from tail tasks.
+        """
+        input_link_list = self._input_link_list
+        work = work.tolist()
+        eft = eft.tolist()
+        lst = lst.tolist()
+        lft = lft.tolist()
 
         # 1. Extract the list of tail tasks.
-        output_task_list = list(
-            filter(lambda task: len(task.output_task_list) == 0, self.task_list)
-        )
+        output_index_list = [
+            i
+            for i, output_link_list in enumerate(self._output_link_list)
+            if len(output_link_list) == 0
+        ]
 
         # 2. Update the information of critical path of this workflow.
-        self.critical_path_length = max(output_task_list, key=lambda task: task.eft).eft
-        for task in output_task_list:
-            task.lft = self.critical_path_length
-            task.lst = task.lft - task.remaining_work_amount
+        critical_path_length = max(eft[i] for i in output_index_list)
+        for i in output_index_list:
+            lft[i] = critical_path_length
+            lst[i] = lft[i] - work[i]
 
         # 3. Calculate PERT information of all tasks
-        while len(output_task_list) > 0:
-
-            prev_task_list = []
-            for output_task in output_task_list:
-                for prev_task, dependency in output_task.input_task_list:
-                    pre_lft = prev_task.lft
-                    lst = 0
-                    lft = 0
-                    if dependency == BaseTaskDependency.FS:
-                        lft = output_task.lst
-                        lst = lft - prev_task.remaining_work_amount
-                    elif dependency == BaseTaskDependency.SS:
-                        lst = output_task.lst
-                        lft = lst + prev_task.remaining_work_amount
+        while len(output_index_list) > 0:
+            prev_index_list = []
+            for i in output_index_list:
+                for j, dependency in input_link_list[i]:
+                    if j < 0:
+                        continue
+                    if dependency == BaseTaskDependency.SS:
+                        link_lst = lst[i]
+                        link_lft = link_lst + work[j]
                     elif dependency == BaseTaskDependency.FF:
-                        lst = output_task.lst
-                        lft = lst + prev_task.remaining_work_amount
-                        if output_task.lft < lft:
-                            lft = output_task.lft
+                        link_lst = lst[i]
+                        link_lft = link_lst + work[j]
+                        if lft[i] < link_lft:
+                            link_lft = lft[i]
                     elif dependency == BaseTaskDependency.SF:
-                        lst = output_task.lst
-                        lft = lst + prev_task.remaining_work_amount
-                        if output_task.lft < lst:
-                            lst = output_task.lft
+                        link_lst = lst[i]
+                        link_lft = link_lst + work[j]
+                        if lft[i] < link_lst:
+                            link_lst = lft[i]
                     else:
-                        lft = output_task.lst
-                        lst = lft - prev_task.remaining_work_amount
-                    if pre_lft < 0 or pre_lft >= lft:
-                        prev_task.lst = lst
-                        prev_task.lft = lft
-                    prev_task_list.append(prev_task)
+                        link_lft = lst[i]
+                        link_lst = link_lft - work[j]
+                    pre_lft = lft[j]
+                    if pre_lft < 0 or pre_lft >= link_lft:
+                        lst[j] = link_lst
+                        lft[j] = link_lft
+                    prev_index_list.append(j)
+            output_index_list = prev_index_list
+
+        return (
+            np.array(lst, dtype=np.float64),
+            np.array(lft, dtype=np.float64),
+            critical_path_length,
+        )
+
+    def build_edges_from_arrays(self, src, dst, dependency=BaseTaskDependency.FS):
+        """
+        Append dependency links between BaseTasks in task_list at once.
+        This is equal to calling
+        task_list[dst[i]].append_input_task(task_list[src[i]], dependency[i])
+        for each link i in order.
 
-            output_task_list = prev_task_list
+        Args:
+            src (numpy.ndarray):
+                Index of input BaseTask of each link in task_list.
+            dst (numpy.ndarray):
+                Index of output BaseTask of each link in task_list.
+            dependency (BaseTaskDependency or numpy.ndarray, optional):
+                Dependency of all links or of each link.
+                Defaults to BaseTaskDependency.FS.
+        Examples:
+            >>> t1, t2, t3 = BaseTask("t1"), BaseTask("t2"), BaseTask("t3")
+            >>> w = BaseWorkflow([t1, t2, t3])
+            >>> w.build_edges_from_arrays([0, 0, 1], [1, 2, 2])
+            >>> print([input_t.name for input_t, _ in t3.input_task_list])
+            ['t1', 't2']
+        """
+        src = np.asarray(src, dtype=np.int64).ravel()
+        dst = np.asarray(dst, dtype=np.int64).ravel()
+        if len(src) != len(dst):
+            raise ValueError("src and dst must have the same length")
+        n_task = len(self.task_list)
+        if len(src) > 0 and (
+            min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= n_task
+        ):
+            raise IndexError("task index is out of range of task_list")
+        dependency_array = np.empty(max(BaseTaskDependency) + 1, dtype=object)
+        for d in BaseTaskDependency:
+            dependency_array[d] = d
+        dependency_array = dependency_array[
+            np.broadcast_to(np.asarray(dependency, dtype=np.int64), src.shape)
+        ]
+        task_array = np.empty(n_task, dtype=object)
+        task_array[:] = self.task_list
+
+        # Links are grouped by the task whose list is extended, keeping their order.
+        for owner, other, list_name in (
+            (dst, src, "input_task_list"),
+            (src, dst, "output_task_list"),
+        ):
+            order = np.argsort(owner, kind="stable")
+            n_link = np.bincount(owner, minlength=n_task)
+            indptr = np.concatenate([[0], np.cumsum(n_link)]).tolist()
+            link_list = list(
+                zip(task_array[other[order]].tolist(), dependency_array[order].tolist())
+            )
+            for i in np.flatnonzero(n_link).tolist():
+                getattr(self.task_list[i], list_name).extend(
+                    link_list[indptr[i] : indptr[i + 1]]
+                )
 
     def reverse_dependencies(self):
         """
@@ -360,21 +598,11 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
         Note:
             This method is developed only for backward simulation.
         """
-        # 1.
-        # Register the input_task_list to dummy_output_task_list
-        # Register the output_task_list to dummy_input_task_list
-        for task in self.task_list:
-            task.dummy_output_task_list = task.input_task_list
-            task.dummy_input_task_list = task.output_task_list
-
-        # 2.
-        # Register the dummy_output_task_list to output_task_list
-        # Register the dummy_input_task_list to input_task_list
-        # Delete the dummy_output_task_list, dummy_input_task_list
         for task in self.task_list:
-            task.output_task_list = task.dummy_output_task_list
-            task.input_task_list = task.dummy_input_task_list
-            del task.dummy_output_task_list, task.dummy_input_task_list
+            task.input_task_list, task.output_task_list = (
+                task.output_task_list,
+                task.input_task_list,
+            )
 
     def perform(self, time: int, seed=None):
         """
@@ -437,6 +665,8 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
             fig: fig in plt.subplots()
             gnt: gnt in plt.subplots()
         """
+        import matplotlib.pyplot as plt
+
         fig, gnt = plt.subplots()
         gnt.set_xlabel("step")
         gnt.grid(True)
@@ -451,39 +681,34 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
         gnt.set_yticks(yticks)
         gnt.set_yticklabels(yticklabels)
 
-        for ttime in range(len(target_task_list)):
-            task = target_task_list[ttime]
-            wlist = []  # time list from start to finish+finish_margin
-            rlist = []  # time list from ready to start
-            for wtime in range(len(task.start_time_list)):
-                wlist.append(
-                    (
-                        task.start_time_list[wtime],
-                        task.finish_time_list[wtime]
-                        - task.start_time_list[wtime]
-                        + finish_margin,
-                    )
-                )
-                rlist.append(
-                    (
-                        task.ready_time_list[wtime] + finish_margin,
-                        task.start_time_list[wtime] - task.ready_time_list[wtime],
-                    )
-                )
-            if task.auto_task:
-                if view_ready:
-                    gnt.broken_barh(
-                        rlist, (yticks[ttime] - 5, 9), facecolors=(ready_color)
-                    )
-                gnt.broken_barh(
-                    wlist, (yticks[ttime] - 5, 9), facecolors=(auto_task_color)
-                )
-            else:
-                if view_ready:
-                    gnt.broken_barh(
-                        rlist, (yticks[ttime] - 5, 9), facecolors=(ready_color)
-                    )
-                gnt.broken_barh(wlist, (yticks[ttime] - 5, 9), facecolors=(task_color))
+        # Bars of all tasks are drawn as one collection for each color.
+        ready_list, start_list, finish_list, ytick_list, auto_list = [], [], [], [], []
+        for ytick, task in zip(yticks, target_task_list):
+            n_interval = len(task.start_time_list)
+            ready_list.extend(task.ready_time_list[:n_interval])
+            start_list.extend(task.start_time_list)
+            finish_list.extend(task.finish_time_list[:n_interval])
+            ytick_list.extend([ytick] * n_interval)
+            auto_list.extend([task.auto_task] * n_interval)
+        ready = np.array(ready_list, dtype=np.float64)
+        start = np.array(start_list, dtype=np.float64)
+        finish = np.array(finish_list, dtype=np.float64)
+        bottom = np.array(ytick_list, dtype=np.float64) - 5
+        auto = np.array(auto_list, dtype=bool)
+
+        if view_ready:
+            _add_bar_collection(
+                gnt, ready + finish_margin, start - ready, bottom, 9, ready_color
+            )
+        for mask, color in ((auto, auto_task_color), (~auto, task_color)):
+            _add_bar_collection(
+                gnt,
+                start[mask],
+                finish[mask] - start[mask] + finish_margin,
+                bottom[mask],
+                9,
+                color,
+            )
 
         if save_fig_path is not None:
             plt.savefig(save_fig_path)
@@ -516,17 +741,13 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
         Returns:
             list[dict]: Gantt plotly information of this BaseWorkflow
         """
-        df = []
-        for task in self.task_list:
-            df.extend(
-                task.create_data_for_gantt_plotly(
-                    init_datetime,
-                    unit_timedelta,
-                    finish_margin=finish_margin,
-                    view_ready=view_ready,
-                )
-            )
-        return df
+        return _create_data_for_gantt_plotly(
+            self.task_list,
+            init_datetime,
+            unit_timedelta,
+            finish_margin=finish_margin,
+            view_ready=view_ready,
+        )
 
     def create_gantt_plotly(
         self,
@@ -587,6 +808,8 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
         TODO:
             Saving figure file is not implemented...
         """
+        import plotly.figure_factory as ff
+
         colors = (
             colors
             if colors is not None
@@ -621,20 +844,51 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
 
         Returns:
             G: networkx.Digraph()
+
+        Note:
+            The graph is cached and reused while the structure of
+            this workflow is not changed. Copy it before modifying.
         """
+        import networkx as nx
+
+        self.__update_dependency_cache()
+        if (
+            self._graph_cache is not None
+            and self._graph_cache_version == self._graph_version
+        ):
+            return self._graph_cache
+
         G = nx.DiGraph()
 
         # 1. add all nodes
-        for task in self.task_list:
-            G.add_node(task)
+        G.add_nodes_from(self.task_list)
 
         # 2. add all edges
-        for task in self.task_list:
-            for input_task, dependency in task.input_task_list:
-                G.add_edge(input_task, task)
+        task_list = self.task_list
+        n_task = len(task_list)
+        G.add_edges_from(
+            (task_list[i], task_list[j])
+            for i, j in zip(self._link_src.tolist(), self._link_dst.tolist())
+            if i < n_task
+        )
 
+        self._graph_cache = G
+        self._graph_cache_version = self._graph_version
         return G
 
+    def _get_graph_and_pos(self, G=None, pos=None, layout="spring"):
+        """
+        Get networkx graph and its layout for drawing this workflow.
+        The layout of the graph built by this class is cached and reused
+        while the graph is not rebuilt. The layout of a given G is not cached.
+        """
+        if G is not None:
+            return G, pos if pos is not None else _get_layout(G, layout)
+        G = self.get_networkx_graph()
+        if pos is None:
+            pos = _get_layout(G, layout, self._pos_cache)
+        return G, pos
+
     def draw_networkx(
         self,
         G=None,
@@ -643,6 +897,7 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
         with_labels=True,
         task_node_color="#00EE00",
         auto_task_node_color="#005500",
+        layout="spring",
         **kwds,
     ):
         """
@@ -654,7 +909,7 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
                 Defaults to None -> self.get_networkx_graph().
             pos (networkx.layout, optional):
                 Layout of networkx.
-                Defaults to None -> networkx.spring_layout(G).
+                Defaults to None -> layout of G by `layout`.
             arrows (bool, optional):
                 Digraph or Graph(no arrows).
                 Defaults to True.
@@ -667,13 +922,18 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
             auto_task_node_color (str, optional):
                 Node color setting information.
                 Defaults to "#005500".
+            layout (str, optional):
+                Layout of networkx used when pos is None.
+                "spring" or "shell" is available.
+                Defaults to "spring".
             **kwds:
                 another networkx settings.
         Returns:
             figure: Figure for a network
         """
-        G = G if G is not None else self.get_networkx_graph()
-        pos = pos if pos is not None else nx.spring_layout(G)
+        import networkx as nx
+
+        G, pos = self._get_graph_and_pos(G=G, pos=pos, layout=layout)
         # nx.draw_networkx(G, pos=pos, arrows=arrows, with_labels=with_labels, **kwds)
 
         # normal task
@@ -708,6 +968,7 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
         node_size=20,
         task_node_color="#00EE00",
         auto_task_node_color="#005500",
+        layout="spring",
     ):
         """
         Get nodes and edges information of plotly network.
@@ -718,7 +979,7 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
                 Defaults to None -> self.get_networkx_graph().
             pos (networkx.layout, optional):
                 Layout of networkx.
-                Defaults to None -> networkx.spring_layout(G).
+                Defaults to None -> layout of G by `layout`.
             node_size (int, optional):
                 Node size setting information.
                 Defaults to 20.
@@ -728,14 +989,19 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
             auto_task_node_color (str, optional):
                 Node color setting information.
                 Defaults to "#005500".
+            layout (str, optional):
+                Layout of networkx used when pos is None.
+                "spring" or "shell" is available.
+                Defaults to "spring".
 
         Returns:
             task_node_trace: Normal Task Node information of plotly network.
             auto_task_node_trace: Auto Task Node information of plotly network.
             edge_trace: Edge information of plotly network.
         """
-        G = G if G is not None else self.get_networkx_graph()
-        pos = pos if pos is not None else nx.spring_layout(G)
+        import plotly.graph_objects as go
+
+        G, pos = self._get_graph_and_pos(G=G, pos=pos, layout=layout)
 
         task_node_trace = go.Scatter(
             x=[],
@@ -755,28 +1021,30 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
             marker=dict(color=auto_task_node_color, size=node_size,),
         )
 
-        for node in G.nodes:
-            x, y = pos[node]
-            if not node.auto_task:
-                task_node_trace["x"] = task_node_trace["x"] + (x,)
-                task_node_trace["y"] = task_node_trace["y"] + (y,)
-                task_node_trace["text"] = task_node_trace["text"] + (node,)
-            elif node.auto_task:
-                auto_task_node_trace["x"] = auto_task_node_trace["x"] + (x,)
-                auto_task_node_trace["y"] = auto_task_node_trace["y"] + (y,)
-                auto_task_node_trace["text"] = auto_task_node_trace["text"] + (node,)
+        node_list = list(G.nodes)
+        pos_array = np.array([pos[node] for node in node_list], dtype=np.float64)
+        pos_array = pos_array.reshape(-1, 2)
+        is_auto_task = np.array([node.auto_task for node in node_list], dtype=bool)
+
+        task_node_trace["x"] = pos_array[~is_auto_task, 0].tolist()
+        task_node_trace["y"] = pos_array[~is_auto_task, 1].tolist()
+        task_node_trace["text"] = [node for node in node_list if not node.auto_task]
+        auto_task_node_trace["x"] = pos_array[is_auto_task, 0].tolist()
+        auto_task_node_trace["y"] = pos_array[is_auto_task, 1].tolist()
+        auto_task_node_trace["text"] = [node for node in node_list if node.auto_task]
 
         edge_trace = go.Scatter(
             x=[], y=[], line=dict(width=1, color="#888"), hoverinfo="none", mode="lines"
         )
 
-        for edge in G.edges:
-            x = edge[0]
-            y = edge[1]
-            xposx, xposy = pos[x]
-            yposx, yposy = pos[y]
-            edge_trace["x"] += (xposx, yposx)
-            edge_trace["y"] += (xposy, yposy)
+        # (x, y) of both ends of each edge are stored in pairs.
+        node_index = {node: i for i, node in enumerate(node_list)}
+        edge_index = np.array(
+            [(node_index[x], node_index[y]) for x, y in G.edges], dtype=np.int64
+        ).reshape(-1, 2)
+        edge_pos = pos_array[edge_index]
+        edge_trace["x"] = edge_pos[:, :, 0].ravel().tolist()
+        edge_trace["y"] = edge_pos[:, :, 1].ravel().tolist()
 
         return task_node_trace, auto_task_node_trace, edge_trace
 
@@ -789,6 +1057,7 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
         task_node_color="#00EE00",
         auto_task_node_color="#005500",
         save_fig_path=None,
+        layout="spring",
     ):
         """
         Draw plotly network
@@ -799,7 +1068,7 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
                 Defaults to None -> self.get_networkx_graph().
             pos (networkx.layout, optional):
                 Layout of networkx.
-                Defaults to None -> networkx.spring_layout(G).
+                Defaults to None -> layout of G by `layout`.
             title (str, optional):
                 Figure title of this network.
                 Defaults to "Workflow".
@@ -815,6 +1084,10 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
             save_fig_path (str, optional):
                 Path of saving figure.
                 Defaults to None.
+            layout (str, optional):
+                Layout of networkx used when pos is None.
+                "spring" or "shell" is available.
+                Defaults to "spring".
 
         Returns:
             figure: Figure for a network
@@ -822,8 +1095,9 @@ class BaseWorkflow(object, metaclass=abc.ABCMeta):
         TODO:
             Saving figure file is not implemented...
         """
-        G = G if G is not None else self.get_networkx_graph()
-        pos = pos if pos is not None else nx.spring_layout(G)
+        import plotly.graph_objects as go
+
+        G, pos = self._get_graph_and_pos(G=G, pos=pos, layout=layout)
         (
             task_node_trace,
             auto_task_node_trace,
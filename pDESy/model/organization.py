@@ -25,5 +25,7 @@ class Organization(BaseOrganization):
             Defaults to None -> [].
     """
 
+    __slots__ = ()
+
     def __init__(self, team_list: List[BaseTeam], factory_list=None, cost_list=None):
         super().__init__(team_list, factory_list=factory_list, cost_list=cost_list)
@@ -16,5 +16,7 @@ class Product(BaseProduct):
             List of BaseComponents
     """
 
+    __slots__ = ()
+
     def __init__(self, component_list: List[BaseComponent]):
         super().__init__(component_list)
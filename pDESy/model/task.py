@@ -117,6 +117,8 @@ class Task(BaseTask):
             Defaults to False.
     """
 
+    __slots__ = ("additional_work_amount", "additional_task_flag", "actual_work_amount")
+
     def __init__(
         self,
         # Basic parameters
@@ -191,9 +193,7 @@ class Task(BaseTask):
             self.additional_task_flag = additional_task_flag
         else:
             self.additional_task_flag = False
-        self.actual_work_amount = self.default_work_amount * (
-            1.0 - self.default_progress
-        )
+        self.actual_work_amount = self._initial_remaining
 
     def initialize(self, error_tol=1e-10):
         """
@@ -218,9 +218,7 @@ class Task(BaseTask):
         super().initialize(error_tol=error_tol)
 
         self.additional_task_flag = False
-        self.actual_work_amount = self.default_work_amount * (
-            1.0 - self.default_progress
-        )
+        self.actual_work_amount = self._initial_remaining
 
     def perform(self, time: int, seed=None, increase_component_error=1.0):
         """
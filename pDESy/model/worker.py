@@ -29,19 +29,19 @@ class Worker(BaseWorker):
         workamount_skill_mean_map (Dict[str, float], optional):
             Basic parameter.
             Skill for expressing progress in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         workamount_skill_sd_map (Dict[str, float], optional):
             Basic parameter.
             Standard deviation of skill for expressing progress in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         quality_skill_mean_map (Dict[str, float], optional):
             Advanced parameter.
             Skill for expressing quality in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         quality_skill_sd_map (Dict[str, float], optional):
             Advanced parameter.
             Standard deviation of skill for expressing quality in unit time.
-            Defaults to {}.
+            Defaults to None -> {}.
         state (BaseResourceState, optional):
             Basic variable.
             State of this worker in simulation.
@@ -68,6 +68,8 @@ class Worker(BaseWorker):
             Defaults to None -> [].
     """
 
+    __slots__ = ("quality_skill_mean_map", "quality_skill_sd_map")
+
     def __init__(
         self,
         # Basic parameters
@@ -75,9 +77,9 @@ class Worker(BaseWorker):
         ID=None,
         team_id=None,
         cost_per_time=0.0,
-        workamount_skill_mean_map={},
-        workamount_skill_sd_map={},
-        facility_skill_map={},
+        workamount_skill_mean_map=None,
+        workamount_skill_sd_map=None,
+        facility_skill_map=None,
         # Basic variables
         state=BaseResourceState.FREE,
         cost_list=None,
@@ -86,8 +88,8 @@ class Worker(BaseWorker):
         assigned_task_list=None,
         assigned_task_id_record=None,
         # Advanced parameters for customized simulation
-        quality_skill_mean_map={},
-        quality_skill_sd_map={},
+        quality_skill_mean_map=None,
+        quality_skill_sd_map=None,
     ):
         super().__init__(
             name,
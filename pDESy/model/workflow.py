@@ -21,6 +21,8 @@ class Workflow(BaseWorkflow):
             Defaults to 0.0.
     """
 
+    __slots__ = ()
+
     def __init__(self, task_list: List[BaseTask]):
         super().__init__(task_list)
 
@@ -22,6 +22,7 @@ def test_init(dummy_facility):
     assert dummy_facility.cost_per_time == 0.0
     assert not dummy_facility.solo_working
     assert dummy_facility.workamount_skill_mean_map == {}
+    assert not hasattr(dummy_facility, "__dict__")
     assert dummy_facility.workamount_skill_sd_map == {}
     # assert dummy_facility.quality_skill_mean_map == {}
     assert dummy_facility.state == BaseFacilityState.FREE
@@ -43,6 +44,7 @@ def test_init(dummy_facility):
     assert w.factory_id is None
     assert w.cost_per_time == 0.0
     assert w.solo_working
+    assert BaseFacility("w2", solo_working=None).solo_working is False
     assert w.workamount_skill_mean_map == {}
     assert w.workamount_skill_sd_map == {}
     # assert w.quality_skill_mean_map == {}
@@ -52,6 +54,8 @@ def test_init(dummy_facility):
     assert w.finish_time_list == [2]
     assert w.assigned_task_list[0].name == "task"
     assert w.assigned_task_id_record == [[], ["ss"]]
+    assert w.workamount_skill_mean_map is not dummy_facility.workamount_skill_mean_map
+    assert w.workamount_skill_sd_map is not dummy_facility.workamount_skill_sd_map
 
 
 def test_str():
@@ -3,9 +3,11 @@
 
 from pDESy.model.base_facility import BaseFacility, BaseFacilityState
 from pDESy.model.base_factory import BaseFactory
+from pDESy.model.base_resource import BaseResourceState
 from pDESy.model.base_component import BaseComponent
 from pDESy.model.base_task import BaseTask
 import datetime
+import pytest
 import os
 
 
@@ -55,6 +57,73 @@ def test_add_facility():
     assert len(factory.facility_list) == 1
     assert facility.factory_id == factory.ID
 
+    factory2 = BaseFactory("factory2")
+    with pytest.raises(ValueError):
+        factory2.add_facility(facility)
+    assert factory2.facility_list == []
+    assert facility.factory_id == factory.ID
+    with pytest.raises(ValueError):
+        BaseFactory("factory3", facility_list=[facility])
+
+
+def test_get_facility_pool():
+    factory = BaseFactory("factory")
+    w1 = BaseFacility("w1", cost_per_time=10.0)
+    w2 = BaseFacility("w2", cost_per_time=5.0)
+    factory.add_facility(w1)
+    pool = factory.get_facility_pool()
+    assert pool.facility_list == [w1]
+    w1.state = BaseFacilityState.WORKING
+    assert pool.state.tolist() == [BaseFacilityState.WORKING]
+    assert pool.cost_per_time.tolist() == [10.0]
+
+    factory.facility_list = [w2, w1]
+    pool = factory.get_facility_pool()
+    assert pool.facility_list == [w2, w1]
+    assert pool.state.tolist() == [BaseFacilityState.FREE, BaseFacilityState.WORKING]
+    assert w1.state == BaseFacilityState.WORKING
+
+    factory.facility_list = [w2]
+    pool = factory.get_facility_pool()
+    assert w1.state == BaseFacilityState.WORKING
+    assert w1.cost_per_time == 10.0
+    w1.state = BaseFacilityState.FREE
+    assert pool.state.tolist() == [BaseFacilityState.FREE]
+
+    w2.state = BaseResourceState.WORKING
+    assert w2.state is BaseFacilityState.WORKING
+    w1.state = BaseResourceState.WORKING
+    assert w1.state is BaseFacilityState.WORKING
+
+
+def test_record_assigned_task_id():
+    factory = BaseFactory("factory")
+    w1 = BaseFacility("w1", assigned_task_id_record=[["a"]])
+    w2 = BaseFacility("w2")
+    factory.facility_list = [w1, w2]
+    task1 = BaseTask("task1")
+    w2.assigned_task_list = [task1]
+    factory.record_assigned_task_id()
+    assert w1.assigned_task_id_record == [["a"], []]
+    assert w2.assigned_task_id_record == [[task1.ID]]
+    factory.record_assigned_task_id()
+    factory.record_assigned_task_id()
+    assert w2.assigned_task_id_record == [[task1.ID], [task1.ID], [task1.ID]]
+    record = w2.assigned_task_id_record
+    record.append(["b"])
+    assert len(w2.assigned_task_id_record) == 4
+    assert w2.assigned_task_id_record[-1] == ["b"]
+    assert record[-2:] == [[task1.ID], ["b"]]
+    w2.assigned_task_id_record = [[task1.ID], [task1.ID], [task1.ID]]
+
+    factory.facility_list = [w2]
+    factory.get_facility_pool()
+    assert w1.assigned_task_id_record == [["a"], [], [], []]
+    w1.record_assigned_task_id()
+    assert len(w1.assigned_task_id_record) == 5
+    factory.initialize()
+    assert w2.assigned_task_id_record == []
+
 
 def test_remove_placed_component():
     c = BaseComponent("c")
@@ -51,6 +51,7 @@ def test_init(dummy_organization):
         "factory",
         "dummy",
     ]
+    assert not hasattr(dummy_organization, "__dict__")
 
 
 def test_initialize(dummy_organization):
@@ -70,6 +71,7 @@ def test_initialize(dummy_organization):
 
 def test_str(dummy_organization):
     print(dummy_organization)
+    assert str(dummy_organization) == str(["c1", "c2"])
 
 
 def test_add_labor_cost(dummy_organization):
@@ -99,6 +101,9 @@ def test_add_labor_cost(dummy_organization):
         add_zero_to_all_facilities=False,
     )
     assert dummy_organization.cost_list == [40.0, 0.0, 35.0]
+    assert facility.cost_list == [20.0, 0.0, 20.0]
+    assert dummy_organization.factory_list[0].cost_list == [20.0, 0.0, 20.0]
+    assert dummy_organization.factory_list[1].cost_list == [0.0, 0.0, 0.0]
 
 
 def test_create_simple_gantt(dummy_organization):
@@ -199,8 +204,21 @@ def test_create_cost_history_plotly(dummy_organization):
 
 
 def test_get_networkx_graph(dummy_organization):
-    dummy_organization.get_networkx_graph()
-    dummy_organization.get_networkx_graph(view_workers=True, view_facilities=True)
+    G = dummy_organization.get_networkx_graph()
+    assert dummy_organization.get_networkx_graph() is G
+    G_all = dummy_organization.get_networkx_graph(
+        view_workers=True, view_facilities=True
+    )
+    assert G_all is not G
+    assert len(G_all.nodes) == 8
+
+    c3 = BaseTeam("c3")
+    dummy_organization.team_list.append(c3)
+    G = dummy_organization.get_networkx_graph()
+    assert c3 in G.nodes
+    c3.parent_team = dummy_organization.team_list[0]
+    G = dummy_organization.get_networkx_graph()
+    assert (dummy_organization.team_list[0], c3) in G.edges
 
 
 def test_draw_networkx(dummy_organization):
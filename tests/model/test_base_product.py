@@ -7,12 +7,14 @@ from pDESy.model.base_task import BaseTask, BaseTaskState
 from pDESy.model.base_factory import BaseFactory
 import datetime
 import os
+import pytest
 
 
 def test_init():
     c1 = BaseComponent("c1")
     product = BaseProduct([c1])
     assert product.component_list == [c1]
+    assert not hasattr(product, "__dict__")
 
 
 def test_initialize():
@@ -23,6 +25,9 @@ def test_initialize():
 
 def test_str():
     print(BaseProduct([]))
+    assert str(BaseProduct([BaseComponent("c1"), BaseComponent("c2")])) == str(
+        ["c1", "c2"]
+    )
 
 
 def test_create_simple_gantt():
@@ -159,7 +164,11 @@ def test_get_networkx_graph():
     c2.parent_component_list = [c1]
     c2.child_component_list = [c3]
     product = BaseProduct([c3, c2, c1])
-    product.get_networkx_graph()
+    G = product.get_networkx_graph()
+    assert product.get_networkx_graph() is G
+    c1.child_component_list = [c2]
+    G = product.get_networkx_graph()
+    assert (c1, c2) in G.edges
     # TODO
     # assert set(G.nodes) == set([c3, c2, c1])
     # assert set(G.edges) ==   # not yet
@@ -185,6 +194,11 @@ def test_get_node_and_edge_trace_for_plotly_network():
     c2.child_component_list = [c3]
     product = BaseProduct([c3, c2, c1])
     node_trace, edge_trace = product.get_node_and_edge_trace_for_plotly_network()
+    node_trace2, _ = product.get_node_and_edge_trace_for_plotly_network()
+    assert node_trace2["x"] == node_trace["x"]
+    product.get_node_and_edge_trace_for_plotly_network(layout="shell")
+    with pytest.raises(ValueError):
+        product.get_node_and_edge_trace_for_plotly_network(layout="xxx")
     # TODO
     # assert node_trace["x"] == (-0.3579082411734774, -0.6420917588265226, 1.0)
     # assert node_trace["y"] == (
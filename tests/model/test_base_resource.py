@@ -43,6 +43,7 @@ def test_init(dummy_worker):
     assert w.name == "w1"
     assert w.team_id is None
     assert w.solo_working
+    assert BaseResource("w2", solo_working=None).solo_working is False
     assert w.cost_per_time == 0.0
     assert w.workamount_skill_mean_map == {}
     assert w.workamount_skill_sd_map == {}
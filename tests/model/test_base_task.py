@@ -7,6 +7,7 @@ from pDESy.model.base_task import BaseTask
 from pDESy.model.base_task import BaseTaskState, BaseTaskDependency
 from pDESy.model.base_component import BaseComponent
 import datetime
+import numpy as np
 
 
 def test_init():
@@ -21,6 +22,7 @@ def test_init():
     assert task.target_component is None
     assert task.default_progress == 0.0
     # assert task.additional_work_amount == 0.0
+    assert not hasattr(task, "__dict__")
     assert task.est == 0.0
     assert task.eft == 0.0
     assert task.lst == -1.0
@@ -69,8 +71,17 @@ def test_append_input_task():
     task1 = BaseTask("task1")
     task2 = BaseTask("task2")
     task2.append_input_task(task1)
-    assert task2.input_task_list == [[task1, BaseTaskDependency.FS]]
-    assert task1.output_task_list == [[task2, BaseTaskDependency.FS]]
+    assert task2.input_task_list == [(task1, BaseTaskDependency.FS)]
+    assert task1.output_task_list == [(task2, BaseTaskDependency.FS)]
+
+    # Links are stored as tuples but still match the list form.
+    task3 = BaseTask("task3", input_task_list=[[task1, BaseTaskDependency.SS]])
+    assert isinstance(task3.input_task_list[0], tuple)
+    assert task3.input_task_list == [[task1, BaseTaskDependency.SS]]
+    task2.input_task_list.append([task3, BaseTaskDependency.FS])
+    assert isinstance(task2.input_task_list[1], tuple)
+    task2.input_task_list.remove([task1, BaseTaskDependency.FS])
+    assert task2.input_task_list == [(task3, BaseTaskDependency.FS)]
 
 
 def test_extend_input_task_list():
@@ -79,11 +90,11 @@ def test_extend_input_task_list():
     task2 = BaseTask("task2")
     task2.extend_input_task_list([task11, task12])
     assert task2.input_task_list == [
-        [task11, BaseTaskDependency.FS],
-        [task12, BaseTaskDependency.FS],
+        (task11, BaseTaskDependency.FS),
+        (task12, BaseTaskDependency.FS),
     ]
-    assert task11.output_task_list == [[task2, BaseTaskDependency.FS]]
-    assert task12.output_task_list == [[task2, BaseTaskDependency.FS]]
+    assert task11.output_task_list == [(task2, BaseTaskDependency.FS)]
+    assert task12.output_task_list == [(task2, BaseTaskDependency.FS)]
 
 
 def test_initialize():
@@ -126,6 +137,12 @@ def test_initialize():
     task.initialize()
     assert task.state == BaseTaskState.FINISHED
 
+    task.default_progress = 0.5
+    task.default_work_amount = 4.0
+    task.initialize()
+    assert task.remaining_work_amount == 2.0
+    assert task.state == BaseTaskState.READY
+
 
 def test_perform():
     auto = BaseTask("a", auto_task=True, state=BaseTaskState.WORKING)
@@ -207,6 +224,29 @@ def test_get_state_from_record():
     assert task2.get_state_from_record(5) == BaseTaskState.FINISHED
 
 
+def test_get_states_from_record():
+    task1 = BaseTask("task1")
+    task1.ready_time_list = [1, 5]
+    task1.start_time_list = [2, 6]
+    task1.finish_time_list = [3, 7]
+    assert task1.get_states_from_record(np.arange(9)).tolist() == [
+        BaseTaskState.NONE,
+        BaseTaskState.READY,
+        BaseTaskState.WORKING,
+        BaseTaskState.FINISHED,
+        BaseTaskState.FINISHED,
+        BaseTaskState.READY,
+        BaseTaskState.WORKING,
+        BaseTaskState.FINISHED,
+        BaseTaskState.FINISHED,
+    ]
+    task1.ready_time_list.append(9)
+    assert task1.get_states_from_record(np.array([8, 9])).tolist() == [
+        BaseTaskState.FINISHED,
+        BaseTaskState.READY,
+    ]
+
+
 def test_can_add_resources():
     task = BaseTask("task")
     w1 = BaseWorker("w1", solo_working=True)
@@ -106,6 +106,33 @@ def test_add_labor_cost():
     assert w2.cost_list == [0.0, 5.0]
 
 
+def test_record_assigned_task_id():
+    team = BaseTeam("team")
+    w1 = BaseWorker("w1")
+    w2 = BaseWorker("w2")
+    team.worker_list = [w1, w2]
+    task = BaseTask("task")
+    w1.assigned_task_list = [task]
+    team.record_assigned_task_id()
+    assert w1.assigned_task_id_record == [[task.ID]]
+    assert w2.assigned_task_id_record == [[]]
+
+    class NameRecordWorker(BaseWorker):
+        __slots__ = ()
+
+        def record_assigned_task_id(self):
+            self.assigned_task_id_record.append(
+                [task.name for task in self.assigned_task_list]
+            )
+
+    w3 = NameRecordWorker("w3")
+    w3.assigned_task_list = [task]
+    team.worker_list = [w1, w3]
+    team.record_assigned_task_id()
+    assert w1.assigned_task_id_record == [[task.ID], [task.ID]]
+    assert w3.assigned_task_id_record == [["task"]]
+
+
 def test_str():
     print(BaseTeam("aaaaaaaa"))
 
@@ -25,6 +25,7 @@ def test_init(dummy_worker):
     assert dummy_worker.workamount_skill_mean_map == {}
     assert dummy_worker.workamount_skill_sd_map == {}
     assert dummy_worker.facility_skill_map == {}
+    assert not hasattr(dummy_worker, "__dict__")
     assert dummy_worker.state == BaseResourceState.FREE
     assert dummy_worker.cost_list == []
     assert dummy_worker.start_time_list == []
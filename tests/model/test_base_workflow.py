@@ -10,6 +10,7 @@ from pDESy.model.base_resource import BaseResource
 from pDESy.model.base_facility import BaseFacility
 from pDESy.model.base_component import BaseComponent
 import os
+import numpy as np
 
 import pytest
 
@@ -69,29 +70,58 @@ def SF_workflow(scope="function"):
     return BaseWorkflow([task1, task2, task3])
 
 
+def test_build_edges_from_arrays():
+    task_list = [BaseTask("t" + str(i)) for i in range(4)]
+    w = BaseWorkflow(task_list)
+    w.build_edges_from_arrays([0, 1, 0, 2], [2, 2, 3, 3])
+    assert task_list[2].input_task_list == [
+        (task_list[0], BaseTaskDependency.FS),
+        (task_list[1], BaseTaskDependency.FS),
+    ]
+    assert task_list[0].output_task_list == [
+        (task_list[2], BaseTaskDependency.FS),
+        (task_list[3], BaseTaskDependency.FS),
+    ]
+    assert task_list[1].input_task_list == []
+    w.initialize()
+    assert w.critical_path_length == 30.0
+
+    w.build_edges_from_arrays(
+        [0, 1], [1, 3], [BaseTaskDependency.SS, BaseTaskDependency.FF]
+    )
+    assert task_list[1].input_task_list == [(task_list[0], BaseTaskDependency.SS)]
+    assert task_list[3].input_task_list[-1] == (task_list[1], BaseTaskDependency.FF)
+    assert task_list[1].output_task_list[-1] == (task_list[3], BaseTaskDependency.FF)
+
+    with pytest.raises(ValueError):
+        w.build_edges_from_arrays([0, 1], [2])
+    with pytest.raises(IndexError):
+        w.build_edges_from_arrays([0], [4])
+
+
 def test_reverse_dependencies(dummy_workflow):
     assert dummy_workflow.task_list[0].input_task_list == []
     assert dummy_workflow.task_list[0].output_task_list == [
-        [dummy_workflow.task_list[2], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[2], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[1].input_task_list == []
     assert dummy_workflow.task_list[1].output_task_list == [
-        [dummy_workflow.task_list[2], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[2], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[2].input_task_list == [
-        [dummy_workflow.task_list[0], BaseTaskDependency.FS],
-        [dummy_workflow.task_list[1], BaseTaskDependency.FS],
+        (dummy_workflow.task_list[0], BaseTaskDependency.FS),
+        (dummy_workflow.task_list[1], BaseTaskDependency.FS),
     ]
     assert dummy_workflow.task_list[2].output_task_list == [
-        [dummy_workflow.task_list[4], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[4], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[3].input_task_list == []
     assert dummy_workflow.task_list[3].output_task_list == [
-        [dummy_workflow.task_list[4], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[4], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[4].input_task_list == [
-        [dummy_workflow.task_list[2], BaseTaskDependency.FS],
-        [dummy_workflow.task_list[3], BaseTaskDependency.FS],
+        (dummy_workflow.task_list[2], BaseTaskDependency.FS),
+        (dummy_workflow.task_list[3], BaseTaskDependency.FS),
     ]
     assert dummy_workflow.task_list[4].output_task_list == []
 
@@ -99,26 +129,26 @@ def test_reverse_dependencies(dummy_workflow):
 
     assert dummy_workflow.task_list[0].output_task_list == []
     assert dummy_workflow.task_list[0].input_task_list == [
-        [dummy_workflow.task_list[2], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[2], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[1].output_task_list == []
     assert dummy_workflow.task_list[1].input_task_list == [
-        [dummy_workflow.task_list[2], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[2], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[2].output_task_list == [
-        [dummy_workflow.task_list[0], BaseTaskDependency.FS],
-        [dummy_workflow.task_list[1], BaseTaskDependency.FS],
+        (dummy_workflow.task_list[0], BaseTaskDependency.FS),
+        (dummy_workflow.task_list[1], BaseTaskDependency.FS),
     ]
     assert dummy_workflow.task_list[2].input_task_list == [
-        [dummy_workflow.task_list[4], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[4], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[3].output_task_list == []
     assert dummy_workflow.task_list[3].input_task_list == [
-        [dummy_workflow.task_list[4], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[4], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[4].output_task_list == [
-        [dummy_workflow.task_list[2], BaseTaskDependency.FS],
-        [dummy_workflow.task_list[3], BaseTaskDependency.FS],
+        (dummy_workflow.task_list[2], BaseTaskDependency.FS),
+        (dummy_workflow.task_list[3], BaseTaskDependency.FS),
     ]
     assert dummy_workflow.task_list[4].input_task_list == []
 
@@ -126,26 +156,26 @@ def test_reverse_dependencies(dummy_workflow):
 
     assert dummy_workflow.task_list[0].input_task_list == []
     assert dummy_workflow.task_list[0].output_task_list == [
-        [dummy_workflow.task_list[2], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[2], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[1].input_task_list == []
     assert dummy_workflow.task_list[1].output_task_list == [
-        [dummy_workflow.task_list[2], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[2], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[2].input_task_list == [
-        [dummy_workflow.task_list[0], BaseTaskDependency.FS],
-        [dummy_workflow.task_list[1], BaseTaskDependency.FS],
+        (dummy_workflow.task_list[0], BaseTaskDependency.FS),
+        (dummy_workflow.task_list[1], BaseTaskDependency.FS),
     ]
     assert dummy_workflow.task_list[2].output_task_list == [
-        [dummy_workflow.task_list[4], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[4], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[3].input_task_list == []
     assert dummy_workflow.task_list[3].output_task_list == [
-        [dummy_workflow.task_list[4], BaseTaskDependency.FS]
+        (dummy_workflow.task_list[4], BaseTaskDependency.FS)
     ]
     assert dummy_workflow.task_list[4].input_task_list == [
-        [dummy_workflow.task_list[2], BaseTaskDependency.FS],
-        [dummy_workflow.task_list[3], BaseTaskDependency.FS],
+        (dummy_workflow.task_list[2], BaseTaskDependency.FS),
+        (dummy_workflow.task_list[3], BaseTaskDependency.FS),
     ]
     assert dummy_workflow.task_list[4].output_task_list == []
 
@@ -163,12 +193,81 @@ def test_init():
     w = BaseWorkflow([task1, task2])
     assert w.task_list == [task1, task2]
     assert w.critical_path_length == 0.0
+    assert not hasattr(w, "__dict__")
 
 
 def test_str():
     print(BaseWorkflow([]))
 
 
+def test_get_task_pool():
+    task1 = BaseTask("task1")
+    task2 = BaseTask("task2", state=BaseTaskState.READY)
+    w = BaseWorkflow([task1])
+    pool = w.get_task_pool()
+    assert pool.task_list == [task1]
+    task1.state = BaseTaskState.WORKING
+    assert pool.state.tolist() == [BaseTaskState.WORKING]
+
+    w.task_list = [task2, task1]
+    pool = w.get_task_pool()
+    assert pool.state.tolist() == [BaseTaskState.READY, BaseTaskState.WORKING]
+    assert task1.state == BaseTaskState.WORKING
+
+    w.task_list = [task2]
+    pool = w.get_task_pool()
+    assert task1.state == BaseTaskState.WORKING
+    task1.state = BaseTaskState.FINISHED
+    assert pool.state.tolist() == [BaseTaskState.READY]
+
+    # A task registered to another workflow is synced again.
+    w2 = BaseWorkflow([task2])
+    task2.state = BaseTaskState.FINISHED
+    assert w.get_task_pool().state.tolist() == [BaseTaskState.FINISHED]
+    assert w2.get_task_pool().state.tolist() == [BaseTaskState.FINISHED]
+
+
+def test_dependency_cache():
+    task_list = [BaseTask("t" + str(i)) for i in range(3)]
+    task_list[2].append_input_task(task_list[0])
+    w = BaseWorkflow(task_list)
+    w.initialize()
+    assert w.critical_path_length == 20.0
+
+    # Replacing a link without changing the length of lists is reflected.
+    task_list[2].input_task_list[0] = (task_list[1], BaseTaskDependency.SS)
+    task_list[0].output_task_list.clear()
+    task_list[1].output_task_list = [(task_list[2], BaseTaskDependency.SS)]
+    w.initialize()
+    assert w.critical_path_length == 10.0
+    assert task_list[2].input_task_list == [(task_list[1], BaseTaskDependency.SS)]
+    assert [t.state for t in task_list] == [
+        BaseTaskState.READY,
+        BaseTaskState.READY,
+        BaseTaskState.NONE,
+    ]
+
+    # Links to tasks out of task_list are never satisfied.
+    outside = BaseTask("outside")
+    outside.state = BaseTaskState.FINISHED
+    task_list[2].append_input_task(outside)
+    w.initialize()
+    assert w.critical_path_length == 10.0
+    assert task_list[2].state == BaseTaskState.NONE
+    task_list[1].state = BaseTaskState.WORKING
+    w.check_state(0, BaseTaskState.READY)
+    assert task_list[2].state == BaseTaskState.NONE
+    assert list(w.get_networkx_graph().edges()) == [(task_list[1], task_list[2])]
+
+    # Links changed in another workflow do not invalidate this cache.
+    key = w._dependency_cache_key
+    other_list = [BaseTask("o0"), BaseTask("o1")]
+    other_list[1].append_input_task(other_list[0])
+    BaseWorkflow(other_list).initialize()
+    w.check_state(1, BaseTaskState.READY)
+    assert w._dependency_cache_key == key
+
+
 def test_initialize():
     task = BaseTask("task")
     task.est = 2.0
@@ -176,12 +275,10 @@ def test_initialize():
     task.lst = 3.0
     task.lft = 11.0
     task.remaining_work_amount = 7
-    task.actual_work_amount = 6
     task.state = BaseTaskState.FINISHED
     task.ready_time_list = [1]
     task.start_time_list = [2]
     task.finish_time_list = [15]
-    task.additional_task_flag = True
     task.allocated_worker_list = [BaseResource("w1")]
 
     task_after1 = BaseTask("task_after1")
@@ -209,6 +306,40 @@ def test_initialize():
     assert w.task_list[2].lft == 20.0
     assert w.task_list[2].state == BaseTaskState.NONE
 
+    # PERT data is reused when the workflow is initialized again.
+    pert_cache = w._pert_cache
+    w.critical_path_length = 100.0
+    w.initialize()
+    assert w._pert_cache is pert_cache
+    assert w.critical_path_length == 20.0
+    assert w.task_list[2].lst == 15.0
+
+    # Changed default values are reflected to PERT data.
+    task.default_progress = 0.5
+    w.initialize()
+    assert w.critical_path_length == 15.0
+    assert w.task_list[0].state == BaseTaskState.READY
+    assert w.task_list[1].est == 5.0
+    task.default_progress = 1.0
+    w.initialize()
+    assert w.critical_path_length == 10.0
+    assert w.task_list[0].state == BaseTaskState.FINISHED
+    assert w.task_list[1].state == BaseTaskState.READY
+
+    # PERT data is calculated from tasks after their initialize().
+    class HalfTask(BaseTask):
+        def initialize(self, error_tol=1e-10):
+            super().initialize(error_tol=error_tol)
+            self.remaining_work_amount = self.default_work_amount / 2
+
+    half_task = HalfTask("half_task")
+    task_after = BaseTask("task_after")
+    task_after.append_input_task(half_task)
+    w = BaseWorkflow([half_task, task_after])
+    w.initialize()
+    assert w.critical_path_length == 15.0
+    assert half_task.eft == 5.0
+
 
 def test_update_PERT_data(SS_workflow, FF_workflow, SF_workflow):
     SS_workflow.update_PERT_data(0)
@@ -235,6 +366,113 @@ def test_update_PERT_data(SS_workflow, FF_workflow, SF_workflow):
     assert (SF_workflow.task_list[1].lst, SF_workflow.task_list[1].lft) == (10, 20)
     assert (SF_workflow.task_list[2].lst, SF_workflow.task_list[2].lft) == (10, 20)
 
+    # Diamond workflow: the longer branch determines PERT data of the last task.
+    task_a = BaseTask("a", default_work_amount=2.0)
+    task_b = BaseTask("b", default_work_amount=5.0)
+    task_c = BaseTask("c", default_work_amount=1.0)
+    task_d = BaseTask("d", default_work_amount=3.0)
+    task_b.append_input_task(task_a)
+    task_c.append_input_task(task_a)
+    task_d.extend_input_task_list([task_b, task_c])
+    w = BaseWorkflow([task_a, task_b, task_c, task_d])
+    w.initialize()
+    assert w.critical_path_length == 10.0
+    assert (task_d.est, task_d.eft, task_d.lst, task_d.lft) == (7, 10, 7, 10)
+    assert (task_c.est, task_c.eft, task_c.lst, task_c.lft) == (2, 3, 6, 7)
+    assert (task_a.est, task_a.eft, task_a.lst, task_a.lft) == (0, 2, 0, 2)
+
+
+def _set_PERT_data_by_reference(task_list, time):
+    """
+    Scalar PERT calculation on BaseTask objects for checking BaseWorkflow.
+    """
+    input_task_list = []
+    for task in task_list:
+        task.est = time
+        if len(task.input_task_list) == 0:
+            task.eft = time + task.remaining_work_amount
+            input_task_list.append(task)
+    while len(input_task_list) > 0:
+        next_task_list = []
+        for input_task in input_task_list:
+            for next_task, dependency in input_task.output_task_list:
+                if dependency == BaseTaskDependency.FS:
+                    est = input_task.est + input_task.remaining_work_amount
+                    eft = est + next_task.remaining_work_amount
+                else:
+                    est = input_task.est
+                    eft = est + next_task.remaining_work_amount
+                    if dependency == BaseTaskDependency.FF and input_task.eft > eft:
+                        eft = input_task.eft
+                    if dependency == BaseTaskDependency.SF and input_task.est > eft:
+                        eft = input_task.est
+                if est >= next_task.est:
+                    next_task.est = est
+                    next_task.eft = eft
+                next_task_list.append(next_task)
+        input_task_list = next_task_list
+
+    output_task_list = [task for task in task_list if len(task.output_task_list) == 0]
+    critical_path_length = max(output_task_list, key=lambda task: task.eft).eft
+    for task in output_task_list:
+        task.lft = critical_path_length
+        task.lst = task.lft - task.remaining_work_amount
+    while len(output_task_list) > 0:
+        prev_task_list = []
+        for output_task in output_task_list:
+            for prev_task, dependency in output_task.input_task_list:
+                pre_lft = prev_task.lft
+                if dependency == BaseTaskDependency.FS:
+                    lft = output_task.lst
+                    lst = lft - prev_task.remaining_work_amount
+                else:
+                    lst = output_task.lst
+                    lft = lst + prev_task.remaining_work_amount
+                    if dependency == BaseTaskDependency.FF and output_task.lft < lft:
+                        lft = output_task.lft
+                    if dependency == BaseTaskDependency.SF and output_task.lft < lst:
+                        lst = output_task.lft
+                if pre_lft < 0 or pre_lft >= lft:
+                    prev_task.lst = lst
+                    prev_task.lft = lft
+                prev_task_list.append(prev_task)
+        output_task_list = prev_task_list
+    return critical_path_length
+
+
+def test_update_PERT_data_by_reference():
+    rng = np.random.default_rng(0)
+    dependency_list = list(BaseTaskDependency)
+    for _ in range(30):
+        n_task = int(rng.integers(2, 9))
+        task_list = [
+            BaseTask(str(i), default_work_amount=float(rng.integers(0, 6)))
+            for i in range(n_task)
+        ]
+        for j in range(1, n_task):
+            for i in range(j):
+                if rng.random() < 0.4:
+                    task_list[j].append_input_task(
+                        task_list[i],
+                        task_dependency_mode=dependency_list[
+                            rng.integers(len(dependency_list))
+                        ],
+                    )
+        shuffled_task_list = [task_list[i] for i in rng.permutation(n_task)]
+        w = BaseWorkflow(shuffled_task_list)
+        w.initialize()
+        for time in range(3):
+            for task in task_list:
+                task.remaining_work_amount = float(rng.integers(0, 6))
+            pert_data = [(t.est, t.eft, t.lst, t.lft) for t in task_list]
+            w.update_PERT_data(time)
+            result = [(t.est, t.eft, t.lst, t.lft) for t in task_list]
+            for task, (est, eft, lst, lft) in zip(task_list, pert_data):
+                task.est, task.eft, task.lst, task.lft = est, eft, lst, lft
+            critical_path_length = _set_PERT_data_by_reference(shuffled_task_list, time)
+            assert w.critical_path_length == critical_path_length
+            assert result == [(t.est, t.eft, t.lst, t.lft) for t in task_list]
+
 
 def test_check_state():
     task1 = BaseTask("task1")
@@ -298,6 +536,46 @@ def test_check_state():
     assert task4.state == BaseTaskState.NONE
     assert task5.state == BaseTaskState.NONE
 
+    # Cached dependencies are updated after changing input tasks.
+    task6 = BaseTask("task6")
+    task7 = BaseTask("task7")
+    w = BaseWorkflow([task6, task7])
+    w.check_state(0, BaseTaskState.READY)
+    task6.state = BaseTaskState.NONE
+    task7.state = BaseTaskState.NONE
+    task7.append_input_task(task6)
+    w.check_state(1, BaseTaskState.READY)
+    assert task6.state == BaseTaskState.READY
+    assert task7.state == BaseTaskState.NONE
+
+
+def test_step():
+    task1 = BaseTask("task1")
+    task2 = BaseTask("task2")
+    task3 = BaseTask("task3")
+    task4 = BaseTask("task4")
+    task3.extend_input_task_list([task1, task2])
+    task4.append_input_task(task3)
+    w = BaseWorkflow([task1, task2, task3, task4])
+    w1 = BaseResource("w1")
+
+    task1.state = BaseTaskState.WORKING
+    task1.remaining_work_amount = 0.0
+    task2.state = BaseTaskState.FINISHED
+    task3.allocated_worker_list = [w1]
+    w.step(3, check_working=False)
+    assert task1.state == BaseTaskState.FINISHED
+    assert task1.finish_time_list == [3]
+    assert task3.state == BaseTaskState.READY
+    assert task3.ready_time_list == [3]
+    assert task4.state == BaseTaskState.NONE
+
+    w.step(4)
+    assert task3.state == BaseTaskState.WORKING
+    assert task3.start_time_list == [4]
+    assert w1.assigned_task_list == [task3]
+    assert task4.state == BaseTaskState.NONE
+
 
 def test___check_ready(SS_workflow, SF_workflow, FF_workflow):
     # For SS_workflow
@@ -500,9 +778,14 @@ def test_get_networkx_graph():
     task2.finish_time_list = [6]
     task2.append_input_task(task1)
     w = BaseWorkflow([task1, task2])
-    w.get_networkx_graph()
-    # TODO
-    # assert...
+    G = w.get_networkx_graph()
+    assert list(G.edges) == [(task1, task2)]
+    assert w.get_networkx_graph() is G
+    task3 = BaseTask("task3")
+    task3.append_input_task(task2)
+    w.task_list.append(task3)
+    G = w.get_networkx_graph()
+    assert list(G.edges) == [(task1, task2), (task2, task3)]
 
 
 def test_draw_networkx():
@@ -540,13 +823,16 @@ def test_get_node_and_edge_trace_for_plotly_network():
     ) = w.get_node_and_edge_trace_for_plotly_network()
     # TODO
     # assert...
+    pos = {task1: (0.0, 1.0), task2: (2.0, 3.0)}
     (
         task_node_trace,
         auto_task_node_trace,
         edge_trace,
-    ) = w.get_node_and_edge_trace_for_plotly_network()
-    # TODO
-    # assert...
+    ) = w.get_node_and_edge_trace_for_plotly_network(pos=pos)
+    assert task_node_trace.x == (0.0, 2.0)
+    assert auto_task_node_trace.x == ()
+    assert edge_trace.x == (0.0, 2.0)
+    assert edge_trace.y == (1.0, 3.0)
 
 
 def test_draw_plotly_network():
@@ -0,0 +1,78 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from pDESy.model._fast import _GrowableArray, _get_datetime_str_list
+from pDESy.model._fast import _add_bar_collection, _get_layout
+import matplotlib.pyplot as plt
+import networkx as nx
+import datetime
+import numpy as np
+import pytest
+
+
+def test_init():
+    a = _GrowableArray()
+    assert len(a) == 0
+    assert a == []
+    a = _GrowableArray([1.0, 2.5])
+    assert a == [1.0, 2.5]
+    assert a.view().dtype == np.float64
+
+
+def test_append():
+    a = _GrowableArray(capacity=1)
+    for i in range(20):
+        a.append(i)
+    assert len(a) == 20
+    assert a[0] == 0.0
+    assert a[-1] == 19.0
+    assert a[1:3] == [1.0, 2.0]
+    assert list(a) == [float(i) for i in range(20)]
+    a.extend([20, 21])
+    assert a.tolist()[-2:] == [20.0, 21.0]
+
+
+def test_clear():
+    a = _GrowableArray([1.0, 2.0])
+    a.clear()
+    assert a == []
+    a.append(3.0)
+    assert a == [3.0]
+    assert np.array(a).tolist() == [3.0]
+
+
+def test_get_layout():
+    G = nx.DiGraph([(0, 1), (1, 2)])
+    pos_cache = {}
+    pos = _get_layout(G, "shell", pos_cache)
+    assert _get_layout(G, "shell", pos_cache) is pos
+    assert _get_layout(nx.DiGraph(G), "shell", pos_cache) is not pos
+
+    G.add_edge(3, 4)
+    assert set(_get_layout(G, "shell")) == {0, 1, 2, 3, 4}
+    with pytest.raises(ValueError):
+        _get_layout(G, "kamada_kawai")
+
+
+def test_get_datetime_str_list():
+    init_datetime = datetime.datetime(2020, 4, 1, 8, 0, 0)
+    unit_timedelta = datetime.timedelta(days=1)
+    assert _get_datetime_str_list(init_datetime, unit_timedelta, [0, 2, 1.5]) == [
+        "2020-04-01 08:00:00",
+        "2020-04-03 08:00:00",
+        "2020-04-02 20:00:00",
+    ]
+    assert _get_datetime_str_list(init_datetime, unit_timedelta, []) == []
+
+
+def test_add_bar_collection():
+    fig, ax = plt.subplots()
+    collection = _add_bar_collection(ax, [1.0, 4.0], [2.0, 1.0], [5.0, 15.0], 9, "red")
+    assert len(collection.get_paths()) == 2
+    assert collection.get_paths()[1].vertices[:4].tolist() == [
+        [4.0, 15.0],
+        [4.0, 24.0],
+        [5.0, 24.0],
+        [5.0, 15.0],
+    ]
+    plt.close(fig)
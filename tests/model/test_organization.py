@@ -51,6 +51,7 @@ def test_init(dummy_organization):
         "factory",
         "dummy",
     ]
+    assert not hasattr(dummy_organization, "__dict__")
 
 
 def test_initialize(dummy_organization):
@@ -12,6 +12,7 @@ def test_init():
     c1 = Component("c1")
     product = Product([c1])
     assert product.component_list == [c1]
+    assert not hasattr(product, "__dict__")
 
 
 def test_initialize():
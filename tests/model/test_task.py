@@ -20,6 +20,7 @@ def test_init():
     assert task.target_component is None
     assert task.default_progress == 0.0
     assert task.additional_work_amount == 0.0
+    assert not hasattr(task, "__dict__")
     assert task.est == 0.0
     assert task.eft == 0.0
     assert task.lst == -1.0
@@ -66,8 +67,8 @@ def test_append_input_task():
     task1 = Task("task1")
     task2 = Task("task2")
     task2.append_input_task(task1)
-    assert task2.input_task_list == [[task1, BaseTaskDependency.FS]]
-    assert task1.output_task_list == [[task2, BaseTaskDependency.FS]]
+    assert task2.input_task_list == [(task1, BaseTaskDependency.FS)]
+    assert task1.output_task_list == [(task2, BaseTaskDependency.FS)]
 
 
 def test_extend_input_task_list():
@@ -76,11 +77,11 @@ def test_extend_input_task_list():
     task2 = Task("task2")
     task2.extend_input_task_list([task11, task12])
     assert task2.input_task_list == [
-        [task11, BaseTaskDependency.FS],
-        [task12, BaseTaskDependency.FS],
+        (task11, BaseTaskDependency.FS),
+        (task12, BaseTaskDependency.FS),
     ]
-    assert task11.output_task_list == [[task2, BaseTaskDependency.FS]]
-    assert task12.output_task_list == [[task2, BaseTaskDependency.FS]]
+    assert task11.output_task_list == [(task2, BaseTaskDependency.FS)]
+    assert task12.output_task_list == [(task2, BaseTaskDependency.FS)]
 
 
 def test_initialize():
@@ -24,6 +24,7 @@ def test_init():
     w = Workflow([task1, task2])
     assert w.task_list == [task1, task2]
     assert w.critical_path_length == 0.0
+    assert not hasattr(w, "__dict__")
 
 
 def test_str():